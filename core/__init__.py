@@ -12,10 +12,11 @@ from .time_utils import (
     combine_datetime_components,
     SOFIA_TIMEZONE,
     TIME_SLOT_FORMAT,
-    RESERVATION_DURATION_MINUTES
+    RESERVATION_DURATION_MINUTES,
+    RESERVATION_DURATION
 )
 
-from .reservation_service import ReservationService
+from .reservation_service import ReservationService, Reservation
 from .table_layout_service import TableLayoutService, TableState
 from .backup_service import BackupService
 
@@ -37,7 +38,9 @@ __all__ = [
     'SOFIA_TIMEZONE',
     'TIME_SLOT_FORMAT',
     'RESERVATION_DURATION_MINUTES',
+    'RESERVATION_DURATION',
     'ReservationService',
+    'Reservation',
     'TableLayoutService',
     'TableState',
     'BackupService',
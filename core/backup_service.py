@@ -10,10 +10,13 @@ Provides database backup and restore functionality with:
 Works on both desktop and mobile (Android/iOS) with cross-platform storage.
 """
 
+import heapq
 import os
+import re
 import shutil
 import sqlite3
 from datetime import datetime, date
+from pathlib import Path
 from typing import List, Dict, Optional, Any
 
 # Import storage utilities for cross-platform path handling
@@ -28,6 +31,47 @@ except ImportError:
         return path
 
 
+# Backup count key -> (table, filter) used by BackupService._get_backup_counts
+_COUNT_SOURCES = {
+    "reservations": ("reservations", " WHERE status = 'Reserved'"),
+    "waiters": ("waiters", ""),
+    "tables": ("tables_metadata", ""),
+    "sections": ("sections", ""),
+}
+
+
+# Backup filenames: <prefix>YYYY-MM-DD_HH-MM-SS<extension>
+_BACKUP_PREFIX = "restaurant_"
+_BACKUP_EXTENSION = ".db"
+
+# Backup filename -> timestamp fields
+_BACKUP_RE = re.compile(
+    re.escape(_BACKUP_PREFIX)
+    + r"(\d{4})-(\d{2})-(\d{2})_(\d{2})-(\d{2})-(\d{2})"
+    + re.escape(_BACKUP_EXTENSION)
+)
+
+
+def _readonly_uri(filepath: str, immutable: bool = False) -> str:
+    """
+    Build a read-only SQLite URI for a database file.
+    
+    Args:
+        filepath: Path of the database file.
+        immutable: Also promise SQLite the file won't change, which skips
+            locking entirely. Only safe for finished backup files.
+    
+    Returns:
+        URI for sqlite3.connect(..., uri=True) or ATTACH on a URI connection.
+    """
+    uri = Path(filepath).resolve().as_uri() + "?mode=ro"
+    return uri + "&immutable=1" if immutable else uri
+
+
+# Pages copied per step by the SQLite online backup in create_backup
+_BACKUP_STEP_PAGES = 1000
+
+
 class BackupService:
     """
     Manages database backups and restores.
@@ -39,12 +83,12 @@ class BackupService:
     - Atomic restore with safety checks
     - Daily auto-backup on startup
     
-    Thread-safe: Uses file-based operations, not SQLite connection-based backup.
+    Thread-safe: Backups use their own SQLite connections; restores use file operations.
     Cross-platform: Uses app storage directory on mobile.
     """
     
-    BACKUP_PREFIX = "restaurant_"
-    BACKUP_EXTENSION = ".db"
+    BACKUP_PREFIX = _BACKUP_PREFIX
+    BACKUP_EXTENSION = _BACKUP_EXTENSION
     
     def __init__(self, db_manager):
         """
@@ -61,6 +105,9 @@ class BackupService:
         
         # Ensure backup folder exists
         self._ensure_backup_folder()
+        
+        # (folder mtime_ns, include_counts, backups) from the last list_backups()
+        self._list_cache: Optional[tuple] = None
     
     def _ensure_backup_folder(self):
         """Create backup folder if it doesn't exist."""
@@ -78,29 +125,39 @@ class BackupService:
     
     def _parse_backup_timestamp(self, filename: str) -> Optional[datetime]:
         """Parse timestamp from backup filename."""
+        match = _BACKUP_RE.fullmatch(filename)
+        if not match:
+            return None
         try:
-            # Remove prefix and extension
-            name = filename.replace(self.BACKUP_PREFIX, "").replace(self.BACKUP_EXTENSION, "")
-            return datetime.strptime(name, "%Y-%m-%d_%H-%M-%S")
+            # Build directly from the groups - no strptime format parsing
+            return datetime(*map(int, match.groups()))
         except ValueError:
             return None
     
-    def _get_backup_metadata(self, filename: str) -> Optional[Dict[str, Any]]:
-        """Get metadata for a backup file."""
-        filepath = self._get_backup_path(filename)
-        
-        if not os.path.exists(filepath):
-            return None
+    def _list_backup_names_with_ts(self) -> List[tuple]:
+        """List (filename, timestamp) pairs for backups - no stat or metadata."""
+        if not os.path.exists(self.backup_folder):
+            return []
         
-        # Get file stats
-        stat = os.stat(filepath)
-        size_bytes = stat.st_size
+        pairs = []
+        for filename in os.listdir(self.backup_folder):
+            timestamp = self._parse_backup_timestamp(filename)
+            if timestamp:
+                pairs.append((filename, timestamp))
+        return pairs
+    
+    def _get_backup_metadata_from_entry(self, entry: os.DirEntry) -> Optional[Dict[str, Any]]:
+        """Get metadata for a backup file from its directory scan entry."""
+        filename = entry.name
         
         # Parse timestamp from filename
         timestamp = self._parse_backup_timestamp(filename)
         if not timestamp:
             return None
         
+        # Get file stats (cached on the entry where the platform allows)
+        size_bytes = entry.stat().st_size
+        
         # Format size for display
         if size_bytes < 1024:
             size_str = f"{size_bytes} B"
@@ -111,15 +168,25 @@ class BackupService:
         
         return {
             "filename": filename,
-            "filepath": filepath,
+            "filepath": entry.path,
             "timestamp": timestamp,
             "timestamp_str": timestamp.strftime("%Y-%m-%d %H:%M:%S"),
             "size_bytes": size_bytes,
             "size_str": size_str,
         }
     
-    def _get_backup_counts(self, filepath: str) -> Dict[str, int]:
-        """Get record counts from a backup database."""
+    def _get_backup_counts(self, conn: sqlite3.Connection, filepath: str) -> Dict[str, int]:
+        """
+        Get record counts from a backup database.
+        
+        Args:
+            conn: Shared URI-enabled connection the backup is attached to
+                for the duration of the call.
+            filepath: Path of the backup file.
+            
+        Returns:
+            Dict of count key -> record count.
+        """
         counts = {
             "reservations": 0,
             "waiters": 0,
@@ -128,48 +195,40 @@ class BackupService:
         }
         
         try:
-            conn = sqlite3.connect(filepath)
-            cursor = conn.cursor()
-            
-            # Count reservations
-            try:
-                cursor.execute("SELECT COUNT(*) FROM reservations WHERE status = 'Reserved'")
-                counts["reservations"] = cursor.fetchone()[0]
-            except:
-                pass
-            
-            # Count waiters
-            try:
-                cursor.execute("SELECT COUNT(*) FROM waiters")
-                counts["waiters"] = cursor.fetchone()[0]
-            except:
-                pass
-            
-            # Count tables
-            try:
-                cursor.execute("SELECT COUNT(*) FROM tables_metadata")
-                counts["tables"] = cursor.fetchone()[0]
-            except:
-                pass
-            
-            # Count sections
-            try:
-                cursor.execute("SELECT COUNT(*) FROM sections")
-                counts["sections"] = cursor.fetchone()[0]
-            except:
-                pass
-            
-            conn.close()
-        except Exception:
+            # Read-only, immutable URI: no locks or journal files next to the backup
+            conn.execute("ATTACH DATABASE ? AS b", (_readonly_uri(filepath, immutable=True),))
+        except sqlite3.Error:
+            return counts
+        
+        try:
+            # Count all tables in one statement; tables missing from
+            # older backups count as 0
+            present = {
+                row[0] for row in
+                conn.execute("SELECT name FROM b.sqlite_master WHERE type = 'table'")
+            }
+            subqueries = [
+                f"(SELECT COUNT(*) FROM b.{table}{where})" if table in present else "0"
+                for table, where in _COUNT_SOURCES.values()
+            ]
+            row = conn.execute(f"SELECT {', '.join(subqueries)}").fetchone()
+            counts.update(zip(_COUNT_SOURCES, row))
+        except sqlite3.Error:
             pass
+        finally:
+            conn.execute("DETACH DATABASE b")
         
         return counts
     
-    def create_backup(self) -> Optional[str]:
+    def create_backup(self, on_progress: Optional[callable] = None) -> Optional[str]:
         """
         Create a new backup of the current database.
         
-        Uses file copy for thread-safety (no connection needed).
+        Uses the SQLite online backup API on dedicated connections, so the
+        copy is consistent even if another connection is mid-write.
+        
+        Args:
+            on_progress: Optional callback for page-copy progress (remaining: int, total: int).
         
         Returns:
             Backup filename if successful, None otherwise.
@@ -182,8 +241,25 @@ class BackupService:
             filename = self._generate_backup_filename()
             filepath = self._get_backup_path(filename)
             
-            # Create backup using file copy (thread-safe)
-            shutil.copy2(self.db_name, filepath)
+            # With a progress callback, copy pages in steps so writers are not
+            # locked out for the whole copy; otherwise copy in a single step
+            src = sqlite3.connect(self.db_name)
+            try:
+                dst = sqlite3.connect(filepath)
+                try:
+                    if on_progress:
+                        src.backup(
+                            dst,
+                            pages=_BACKUP_STEP_PAGES,
+                            progress=lambda status, remaining, total: on_progress(remaining, total),
+                        )
+                    else:
+                        src.backup(dst, pages=-1)
+                finally:
+                    dst.close()
+            finally:
+                src.close()
+            self._list_cache = None
             
             return filename
         except Exception as e:
@@ -202,21 +278,41 @@ class BackupService:
         """
         backups = []
         
-        if not os.path.exists(self.backup_folder):
+        try:
+            folder_mtime = os.stat(self.backup_folder).st_mtime_ns
+        except OSError:
             return backups
         
-        for filename in os.listdir(self.backup_folder):
-            if filename.startswith(self.BACKUP_PREFIX) and filename.endswith(self.BACKUP_EXTENSION):
-                metadata = self._get_backup_metadata(filename)
-                if metadata:
-                    if include_counts:
-                        metadata["counts"] = self._get_backup_counts(metadata["filepath"])
-                    backups.append(metadata)
+        # Folder unchanged since the last listing - reuse it
+        cache = self._list_cache
+        if cache is not None and cache[0] == folder_mtime and cache[1] == include_counts:
+            return list(cache[2])
+        
+        # One in-memory connection serves all count queries; each backup
+        # is attached to it in turn instead of opening its own connection
+        counts_conn = sqlite3.connect("file::memory:", uri=True) if include_counts else None
+        try:
+            with os.scandir(self.backup_folder) as entries:
+                for entry in entries:
+                    filename = entry.name
+                    if not (filename.startswith(self.BACKUP_PREFIX) and filename.endswith(self.BACKUP_EXTENSION)):
+                        continue
+                    if not entry.is_file():
+                        continue
+                    metadata = self._get_backup_metadata_from_entry(entry)
+                    if metadata:
+                        if counts_conn is not None:
+                            metadata["counts"] = self._get_backup_counts(counts_conn, metadata["filepath"])
+                        backups.append(metadata)
+        finally:
+            if counts_conn is not None:
+                counts_conn.close()
         
         # Sort by timestamp, newest first
         backups.sort(key=lambda x: x["timestamp"], reverse=True)
         
-        return backups
+        self._list_cache = (folder_mtime, include_counts, backups)
+        return list(backups)
     
     def delete_backup(self, filename: str) -> bool:
         """
@@ -232,6 +328,7 @@ class BackupService:
             filepath = self._get_backup_path(filename)
             if os.path.exists(filepath):
                 os.remove(filepath)
+                self._list_cache = None
                 return True
             return False
         except Exception as e:
@@ -278,7 +375,10 @@ class BackupService:
         
         # Verify backup is a valid SQLite database
         try:
-            test_conn = sqlite3.connect(filepath)
+            # Read-only and immutable: validation must not take locks or create
+            # journal files (mode=ro alone still leaves -wal/-shm next to a
+            # WAL-mode backup); the backup is a finished file
+            test_conn = sqlite3.connect(_readonly_uri(filepath, immutable=True), uri=True)
             test_conn.execute("SELECT 1 FROM sqlite_master LIMIT 1")
             test_conn.close()
         except Exception as e:
@@ -295,9 +395,12 @@ class BackupService:
             
             # Create safety backup of current state (only if current DB exists)
             if os.path.exists(self.db_name):
+                # Fold any pending WAL frames into the file before copying it
+                self.db_manager.checkpoint_wal()
                 safety_backup = f"_pre_restore_safety_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
                 safety_path = self._get_backup_path(safety_backup)
                 shutil.copy2(self.db_name, safety_path)
+                self._list_cache = None
                 print(f"[Backup] Safety backup created: {safety_path}")
             
             if on_progress:
@@ -305,16 +408,14 @@ class BackupService:
             
             # Copy backup to temp location first (atomic with temp file)
             temp_path = self.db_name + ".tmp"
-            shutil.copy2(filepath, temp_path)
+            shutil.copyfile(filepath, temp_path)
             print(f"[Backup] Copied backup to temp: {temp_path}")
             
-            # Replace current DB with restored backup
-            if os.path.exists(self.db_name):
-                os.remove(self.db_name)
-                print(f"[Backup] Removed current database")
-            
-            os.rename(temp_path, self.db_name)
-            temp_path = None  # Clear temp_path since rename succeeded
+            # Atomically replace current DB with restored backup; pooled
+            # connections are closed first so none keeps reading the old file
+            self.db_manager.close()
+            os.replace(temp_path, self.db_name)
+            temp_path = None  # Clear temp_path since replace succeeded
             print(f"[Backup] Database restored: {self.db_name}")
             
             if on_progress:
@@ -351,13 +452,15 @@ class BackupService:
     
     def has_today_backup(self) -> bool:
         """Check if a backup exists for today."""
-        today = date.today()
-        
-        for backup in self.list_backups():
-            if backup["timestamp"].date() == today:
-                return True
+        if not os.path.exists(self.backup_folder):
+            return False
         
-        return False
+        # Backup filenames start with the date - no stat or timestamp parsing needed
+        prefix = f"{self.BACKUP_PREFIX}{date.today().strftime('%Y-%m-%d')}_"
+        return any(
+            filename.startswith(prefix) and filename.endswith(self.BACKUP_EXTENSION)
+            for filename in os.listdir(self.backup_folder)
+        )
     
     def create_daily_backup_if_needed(self) -> Optional[str]:
         """
@@ -381,15 +484,16 @@ class BackupService:
         Returns:
             Number of backups deleted.
         """
-        backups = self.list_backups()
+        backups = self._list_backup_names_with_ts()
         deleted = 0
         
         if len(backups) <= keep_count:
             return 0
         
-        # Remove oldest backups beyond keep_count
-        for backup in backups[keep_count:]:
-            if self.delete_backup(backup["filename"]):
+        # Remove oldest backups beyond keep_count - only those need ordering
+        oldest = heapq.nsmallest(len(backups) - keep_count, backups, key=lambda pair: pair[1])
+        for filename, _ in oldest:
+            if self.delete_backup(filename):
                 deleted += 1
         
         return deleted
@@ -5,9 +5,22 @@ Generates monthly, weekly, and daily reservation charts.
 """
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict, Any, Tuple, Union
 import os
-from collections import defaultdict
+from collections import Counter
+
+# reportlab is only needed for PDF export - keep the module importable without it
+try:
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib import colors as rl_colors
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib.enums import TA_CENTER
+    _REPORTLAB_ERROR = None
+except ImportError as e:
+    _REPORTLAB_ERROR = e
 
 
 def row_get(row: Union[Dict, Any], key: str, default=None):
@@ -22,18 +35,12 @@ def row_get(row: Union[Dict, Any], key: str, default=None):
     Returns:
         Value or default
     """
+    # Dispatch on the exact type once - plain dicts are the common case
+    if type(row) is dict:
+        return row.get(key, default)
     try:
-        # Try dict-style get method first
-        if hasattr(row, 'get'):
-            return row.get(key, default)
-        # Try direct indexing (works for sqlite3.Row)
-        elif hasattr(row, '__getitem__') and hasattr(row, 'keys'):
-            if key in row.keys():
-                return row[key]
-            return default
-        # Fallback for other dict-like objects
-        else:
-            return row[key] if key in row else default
+        # sqlite3.Row and other mappings support direct indexing
+        return row[key]
     except (KeyError, IndexError, TypeError):
         return default
 
@@ -48,37 +55,79 @@ def get_reservations_by_period(reservations: List[Any]) -> Tuple[Dict, Dict, Dic
     Returns:
         Tuple of (monthly_counts, weekly_counts, daily_counts)
     """
-    monthly = defaultdict(int)
-    weekly = defaultdict(int)
-    daily = defaultdict(int)
+    # Collect the period keys in one pass; counting is left to Counter
+    months = []
+    weeks = []
+    days = []
+    
+    # Day key -> week key; many reservations share a day, so each
+    # distinct day is parsed only once
+    week_of = {}
     
-    for res in reservations:
-        try:
-            # Get time_slot value safely
-            time_slot = row_get(res, "time_slot", "")
-            if not time_slot:
-                continue
-            
-            # Parse datetime
-            dt = datetime.strptime(time_slot, "%Y-%m-%d %H:%M")
-            
-            # Monthly aggregation (YYYY-MM)
-            month_key = dt.strftime("%Y-%m")
-            monthly[month_key] += 1
-            
-            # Weekly aggregation (YYYY-Www)
-            week_key = dt.strftime("%Y-W%U")
-            weekly[week_key] += 1
-            
-            # Daily aggregation (YYYY-MM-DD)
-            day_key = dt.strftime("%Y-%m-%d")
-            daily[day_key] += 1
-            
-        except (ValueError, TypeError, AttributeError) as e:
-            # Skip rows with invalid/missing time_slot
+    # All rows come from one query, so pick the accessor once from the
+    # first row instead of dispatching per row
+    if reservations and type(reservations[0]) is dict:
+        time_slots = [res.get("time_slot") for res in reservations]
+    else:
+        time_slots = [row_get(res, "time_slot") for res in reservations]
+    
+    for time_slot in time_slots:
+        # Skip rows with invalid/missing time_slot
+        if not isinstance(time_slot, str) or len(time_slot) != 16 or time_slot[10] != " ":
+            continue
+        
+        # Daily aggregation (YYYY-MM-DD) - sliced, no parsing
+        day_key = time_slot[:10]
+        
+        # Weekly aggregation (YYYY-Www) - also validates the date
+        week_key = week_of.get(day_key)
+        if week_key is None:
+            try:
+                week_key = datetime.strptime(day_key, "%Y-%m-%d").strftime("%Y-W%U")
+            except ValueError:
+                week_key = ""
+            week_of[day_key] = week_key
+        if not week_key:
             continue
+        
+        # Monthly aggregation (YYYY-MM)
+        months.append(time_slot[:7])
+        weeks.append(week_key)
+        days.append(day_key)
+    
+    return dict(Counter(months)), dict(Counter(weeks)), dict(Counter(days))
+
+
+@lru_cache(maxsize=1)
+def _get_pdf_styles() -> Tuple[Any, Any, Any]:
+    """
+    Build the PDF styles once, on first export.
     
-    return dict(monthly), dict(weekly), dict(daily)
+    Returns:
+        Tuple of (sample stylesheet, title style, count table style)
+    """
+    styles = getSampleStyleSheet()
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=rl_colors.HexColor('#047857'),
+        spaceAfter=30,
+        alignment=TA_CENTER,
+    )
+    # One style shared by all three count tables
+    table_style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#047857')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 14),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, -1), (-1, -1), rl_colors.HexColor('#E8F5E9')),
+        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+        ('GRID', (0, 0), (-1, -1), 1, rl_colors.grey),
+    ])
+    return styles, title_style, table_style
 
 
 def export_reports_to_pdf(
@@ -99,28 +148,23 @@ def export_reports_to_pdf(
     Returns:
         True if successful, False otherwise
     """
+    if _REPORTLAB_ERROR is not None:
+        print(f"Error generating PDF: {_REPORTLAB_ERROR}")
+        return False
+    
     try:
-        from reportlab.lib.pagesizes import A4
-        from reportlab.lib import colors as rl_colors
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.lib.units import inch
-        from reportlab.lib.enums import TA_CENTER
-        
         # Create PDF document
         doc = SimpleDocTemplate(output_path, pagesize=A4)
         story = []
-        styles = getSampleStyleSheet()
+        styles, title_style, table_style = _get_pdf_styles()
+        
+        def count_table(header: str, keys: List[str], counts: Dict[str, int]):
+            """Build a [header, Count] table for the given keys plus a TOTAL row."""
+            data = [[header, "Count"], *([key, str(counts[key])] for key in keys)]
+            data.append(["TOTAL", str(sum(counts[key] for key in keys))])
+            return Table(data, style=table_style)
         
         # Title
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=rl_colors.HexColor('#047857'),
-            spaceAfter=30,
-            alignment=TA_CENTER,
-        )
         story.append(Paragraph("Reservation Statistics Report", title_style))
         story.append(Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}", styles['Normal']))
         story.append(Spacer(1, 0.3 * inch))
@@ -128,24 +172,7 @@ def export_reports_to_pdf(
         # Monthly statistics
         story.append(Paragraph("Monthly Reservations", styles['Heading2']))
         if monthly:
-            monthly_data = [["Month", "Count"]]
-            for month in sorted(monthly.keys()):
-                monthly_data.append([month, str(monthly[month])])
-            monthly_data.append(["TOTAL", str(sum(monthly.values()))])
-            
-            monthly_table = Table(monthly_data)
-            monthly_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#047857')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 14),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, -1), (-1, -1), rl_colors.HexColor('#E8F5E9')),
-                ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                ('GRID', (0, 0), (-1, -1), 1, rl_colors.grey),
-            ]))
-            story.append(monthly_table)
+            story.append(count_table("Month", sorted(monthly), monthly))
         else:
             story.append(Paragraph("No monthly data available", styles['Normal']))
         
@@ -154,25 +181,8 @@ def export_reports_to_pdf(
         # Weekly statistics
         story.append(Paragraph("Weekly Reservations (Last 12 weeks)", styles['Heading2']))
         if weekly:
-            sorted_weeks = sorted(weekly.keys())[-12:]  # Last 12 weeks
-            weekly_data = [["Week", "Count"]]
-            for week in sorted_weeks:
-                weekly_data.append([week, str(weekly[week])])
-            weekly_data.append(["TOTAL", str(sum(weekly[w] for w in sorted_weeks))])
-            
-            weekly_table = Table(weekly_data)
-            weekly_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#047857')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 14),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, -1), (-1, -1), rl_colors.HexColor('#E8F5E9')),
-                ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                ('GRID', (0, 0), (-1, -1), 1, rl_colors.grey),
-            ]))
-            story.append(weekly_table)
+            sorted_weeks = sorted(weekly)[-12:]  # Last 12 weeks
+            story.append(count_table("Week", sorted_weeks, weekly))
         else:
             story.append(Paragraph("No weekly data available", styles['Normal']))
         
@@ -181,25 +191,8 @@ def export_reports_to_pdf(
         # Daily statistics (last 30 days)
         story.append(Paragraph("Daily Reservations (Last 30 days)", styles['Heading2']))
         if daily:
-            sorted_days = sorted(daily.keys())[-30:]  # Last 30 days
-            daily_data = [["Date", "Count"]]
-            for day in sorted_days:
-                daily_data.append([day, str(daily[day])])
-            daily_data.append(["TOTAL", str(sum(daily[d] for d in sorted_days))])
-            
-            daily_table = Table(daily_data)
-            daily_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), rl_colors.HexColor('#047857')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), rl_colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 14),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, -1), (-1, -1), rl_colors.HexColor('#E8F5E9')),
-                ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
-                ('GRID', (0, 0), (-1, -1), 1, rl_colors.grey),
-            ]))
-            story.append(daily_table)
+            sorted_days = sorted(daily)[-30:]  # Last 30 days
+            story.append(count_table("Date", sorted_days, daily))
         else:
             story.append(Paragraph("No daily data available", styles['Normal']))
         
@@ -212,12 +205,20 @@ def export_reports_to_pdf(
         return False
 
 
-def get_default_export_path() -> str:
-    """Get default path for PDF export."""
+@lru_cache(maxsize=1)
+def _get_export_dir() -> str:
+    """Resolve the export directory once; it doesn't change while the app runs."""
     try:
-        from core.storage import get_data_dir
-        data_dir = get_data_dir()
-        return os.path.join(data_dir, f"reservations_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf")
-    except:
+        from core.storage import get_app_storage_path
+        return str(get_app_storage_path())
+    except Exception:
         # Fallback to current directory
-        return f"reservations_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+        return os.getcwd()
+
+
+def get_default_export_path() -> str:
+    """Get default path for PDF export."""
+    return os.path.join(
+        _get_export_dir(),
+        f"reservations_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
+    )
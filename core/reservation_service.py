@@ -4,14 +4,17 @@ Reservation service - implements business logic for reservation operations.
 This service is UI-agnostic and can be used by any UI framework.
 """
 
-from datetime import datetime
+import sqlite3
+from bisect import bisect_right
+from collections import namedtuple
+from datetime import date, datetime
 from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from .time_utils import (
     parse_time_slot,
-    calculate_reservation_end,
-    is_reservation_ongoing,
+    format_time_slot,
     get_current_sofia_time,
-    RESERVATION_DURATION_MINUTES
+    RESERVATION_DURATION_MINUTES,
+    RESERVATION_DURATION
 )
 
 # Use TYPE_CHECKING to avoid circular import with db.py
@@ -19,6 +22,20 @@ if TYPE_CHECKING:
     from db import DBManager
 
 
+# Lightweight immutable reservation record returned by list queries.
+# Attribute access is cheaper than dict lookups in the UI render loops;
+# use ``_asdict()`` where a mutable dict is needed (e.g. the action panel).
+Reservation = namedtuple(
+    "Reservation",
+    "id table_number time_slot customer_name phone_number additional_info waiter_id status",
+)
+
+
+def _to_reservation(row) -> Reservation:
+    """Build a Reservation from a sqlite3.Row (or any mapping with the same keys)."""
+    return Reservation._make([row[field] for field in Reservation._fields])
+
+
 class ReservationService:
     """
     Business logic for reservations.
@@ -39,11 +56,11 @@ class ReservationService:
     
     def list_reservations_for_context(
         self,
-        selected_date: Optional[datetime] = None,
+        selected_date: Optional[date] = None,
         selected_time: Optional[datetime] = None,
         status_filter: Optional[str] = None,
         table_filter: Optional[int] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Reservation]:
         """
         List reservations with context-aware filtering.
         
@@ -55,55 +72,50 @@ class ReservationService:
         - Always sorted by start time ascending
         
         Args:
-            selected_date: Selected date (constrains to this date boundary)
+            selected_date: Selected date (constrains to this date boundary; a datetime
+                is treated as its date)
             selected_time: Selected specific time (for ongoing + future logic)
             status_filter: Status filter ("Reserved", "Cancelled", None for all)
             table_filter: Table number filter (None for all)
             
         Returns:
-            List of reservation dictionaries sorted by start time, 
+            List of Reservation records sorted by start time, 
             constrained to selected_date if provided
         """
-        all_reservations = self.db.get_reservations()
-        filtered = []
+        # Rows come back ordered by time_slot, which sorts chronologically
+        # as a string. A single date is served from the DB manager's
+        # in-memory index; otherwise the filters are done in SQL.
+        if selected_date is not None:
+            rows = self.db.get_reservations_on_date(selected_date, status=status_filter)
+            if table_filter is not None:
+                rows = [res for res in rows if res["table_number"] == table_filter]
+        else:
+            rows = self.db.query_reservations(status=status_filter, table_number=table_filter)
         
-        for res in all_reservations:
-            # Parse reservation time
-            res_start = parse_time_slot(res["time_slot"])
-            if res_start is None:
-                continue
-            
-            res_end = calculate_reservation_end(res_start)
-            
-            # FIRST: Date filtering (strict boundary - must be on selected date)
-            if selected_date is not None:
-                # Only show reservations that start on the selected date
-                if res_start.date() != selected_date:
-                    continue  # Skip if not on the selected date
-            
-            # SECOND: Time-aware filtering (within the selected date)
-            if selected_time is not None:
-                selected_naive = selected_time.replace(tzinfo=None)
-                
-                # Check if ongoing or future (but already constrained by date above)
-                is_ongoing = is_reservation_ongoing(res_start, res_end, selected_naive)
-                is_future = res_start >= selected_naive
-                
-                if not (is_ongoing or is_future):
-                    continue  # Filter out past reservations
-            
-            # Status filtering
-            if status_filter is not None and res["status"] != status_filter:
-                continue
-            
-            # Table filtering
-            if table_filter is not None and res["table_number"] != table_filter:
-                continue
-            
-            filtered.append(dict(res))
+        # Time-aware filtering (ongoing + future): a reservation is still
+        # ongoing at the selected time iff it started after selected time
+        # minus the duration. Rows are in start order (slots are stored
+        # zero-padded, so string order is time order), so everything past
+        # that point passes - found with a binary search, not a per-row check.
+        if selected_time is not None:
+            selected_naive = selected_time.replace(tzinfo=None)
+            cutoff = format_time_slot(selected_naive - RESERVATION_DURATION)
+            # Bisect a plain slot list (bisect's key= needs Python 3.10+)
+            slots = [res["time_slot"] for res in rows]
+            rows = rows[bisect_right(slots, cutoff):]
+        
+        # Rows are materialized only here, for the survivors. When sqlite3
+        # rows' columns line up with Reservation's fields (SELECT * on the
+        # current schema) their values are taken positionally, not by name.
+        make = _to_reservation
+        if rows and isinstance(rows[0], sqlite3.Row) and tuple(rows[0].keys()) == Reservation._fields:
+            make = Reservation._make
         
-        # Sort by start time ascending
-        filtered.sort(key=lambda r: parse_time_slot(r["time_slot"]) or datetime.min)
+        # Skip rows with unparseable time slots
+        filtered = [
+            make(res) for res in rows
+            if parse_time_slot(res["time_slot"]) is not None
+        ]
         
         return filtered
     
@@ -196,9 +208,6 @@ class ReservationService:
         Returns:
             Reservation dictionary or None if not found
         """
-        reservations = self.db.get_reservations()
-        for res in reservations:
-            if res["id"] == reservation_id:
-                return dict(res)
-        return None
+        res = self.db.get_reservation(reservation_id)
+        return dict(res) if res is not None else None
 
@@ -5,15 +5,16 @@ This service determines table states (FREE, OCCUPIED, SOON_30) based on
 selected date/time context.
 """
 
-from datetime import datetime, timedelta
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
 from typing import Dict, Optional, TYPE_CHECKING
 from enum import Enum
 from .time_utils import (
     parse_time_slot,
-    calculate_reservation_end,
-    is_reservation_ongoing,
-    is_reservation_soon,
-    get_current_sofia_time
+    format_time_slot,
+    get_current_sofia_time,
+    RESERVATION_DURATION
 )
 
 # Use TYPE_CHECKING to avoid circular import with db.py
@@ -28,6 +29,19 @@ class TableState(Enum):
     SOON_30 = "soon_30"  # Will be occupied within 30 minutes
 
 
+# How far ahead of the selected time a reservation counts as SOON_30
+_SOON_WINDOW = timedelta(minutes=30)
+
+# Internal state codes for the per-table state array; mapped to TableState
+# only when the result is built
+_FREE, _OCCUPIED, _SOON_30 = 0, 1, 2
+_STATE_BY_CODE = (TableState.FREE, TableState.OCCUPIED, TableState.SOON_30)
+
+
+# Most recent table-state results kept by TableLayoutService
+_STATES_CACHE_SIZE = 32
+
+
 class TableLayoutService:
     """
     Business logic for table layout visualization.
@@ -46,83 +60,150 @@ class TableLayoutService:
             db_manager: Database manager instance
         """
         self.db = db_manager
+        
+        # Context key -> table states, least recently used first
+        self._states_cache: "OrderedDict[tuple, Dict[int, tuple]]" = OrderedDict()
+        
+        # (selected_date, reservations_version) -> (rows, their time_slots),
+        # for the most recent rows set only
+        self._rows_cache = (None, None)
     
     def get_table_states_for_context(
         self,
         selected_time: Optional[datetime] = None,
-        selected_date: Optional[datetime] = None,
+        selected_date: Optional[date] = None,
         num_tables: int = 50,
-        include_reservation_data: bool = False
+        include_reservation_data: bool = False,
+        include_display_time: bool = False
     ) -> Dict[int, tuple]:
         """
         Get table states for the given context.
         
         Args:
             selected_time: Selected specific time (if None, show future reservations)
-            selected_date: Selected date (constrains to this date only)
+            selected_date: Selected date (constrains to this date only; a datetime
+                is treated as its date)
             num_tables: Total number of tables
             include_reservation_data: If True, return full reservation dict instead of start time
+            include_display_time: If True, append the reservation start formatted as "HH:MM"
+                (None for FREE tables), returning (state, info, hhmm)
             
         Returns:
             Dictionary mapping table_number to (state, info)
             - state: TableState enum
             - info: Additional info (start time for display, or full reservation if include_reservation_data)
+            
+            Results are cached per context until reservations change, so the
+            returned dict must be treated as read-only.
         """
-        all_reservations = self.db.get_reservations()
+        # A datetime and its date select the same day - share one cache entry
+        if isinstance(selected_date, datetime):
+            selected_date = selected_date.date()
+        
+        # Naive, minute-resolution times: slot boundaries are whole minutes,
+        # so seconds never change the result and would only split the cache
+        if selected_time is not None:
+            selected_time = selected_time.replace(tzinfo=None, second=0, microsecond=0)
+            now = None
+        else:
+            now = get_current_sofia_time().replace(tzinfo=None, second=0, microsecond=0)
+        
+        cache_key = (
+            selected_date,
+            selected_time,
+            now,
+            num_tables,
+            include_reservation_data,
+            include_display_time,
+            self.db.reservations_version,
+        )
+        cached = self._states_cache.get(cache_key)
+        if cached is not None:
+            self._states_cache.move_to_end(cache_key)
+            return cached
+        
+        # Only "Reserved" rows on the selected date (no cross-date leakage),
+        # ordered by time_slot
+        rows_key = (selected_date, self.db.reservations_version)
+        key, cached_rows = self._rows_cache
+        if key == rows_key:
+            all_reservations, slots = cached_rows
+        else:
+            if selected_date is not None:
+                all_reservations = self.db.get_reservations_on_date(selected_date, status="Reserved")
+            else:
+                all_reservations = self.db.query_reservations(status="Reserved")
+            # Plain slot strings to bisect (bisect's key= needs Python 3.10+)
+            slots = [res["time_slot"] for res in all_reservations]
+            self._rows_cache = (rows_key, (all_reservations, slots))
         
         # Initialize all tables as FREE
-        table_states = {i: (TableState.FREE, None) for i in range(1, num_tables + 1)}
+        free_state = (TableState.FREE, None, None) if include_display_time else (TableState.FREE, None)
+        table_states = {i: free_state for i in range(1, num_tables + 1)}
         
-        # Track occupied and soon-occupied tables
-        occupied_tables = {}  # table_num -> (res_start, res_data)
-        soon_tables = {}  # table_num -> (res_start, res_data)
+        # Start time -> "HH:MM", formatted once per distinct start time
+        display_times = {}
         
-        for res in all_reservations:
-            # Only consider "Reserved" status
-            if res["status"] != "Reserved":
-                continue
-            
+        def make_state(state, res_start, res_dict):
+            info = res_dict if include_reservation_data else res_start
+            if not include_display_time:
+                return (state, info)
+            hhmm = display_times.get(res_start)
+            if hhmm is None:
+                hhmm = display_times[res_start] = res_start.strftime("%H:%M")
+            return (state, info, hhmm)
+        
+        # Rows are ordered by time_slot, and ISO slot strings compare like
+        # the times they encode, so the rows that can affect a state are
+        # found by binary search on the strings - rows outside are never parsed
+        if selected_time is not None:
+            # Ongoing (started within the last duration) or starting soon
+            lo = format_time_slot(selected_time - RESERVATION_DURATION)
+            hi = format_time_slot(selected_time + _SOON_WINDOW)
+            window = all_reservations[bisect_right(slots, lo):bisect_right(slots, hi)]
+        else:
+            # No specific time - future reservations (within selected date)
+            window = all_reservations[bisect_left(slots, format_time_slot(now)):]
+        
+        # Per-table state codes indexed by table number (index 0 unused),
+        # sized for reservations on tables beyond num_tables as well - those
+        # only appear in the result when taken
+        size = max(num_tables, max((res["table_number"] for res in window), default=0)) + 1
+        states = bytearray(size)  # all _FREE
+        occupied_count = 0
+        
+        # Single pass writing straight into table_states; OCCUPIED wins over
+        # SOON_30, which wins over FREE
+        for res in window:
             res_start = parse_time_slot(res["time_slot"])
             if res_start is None:
                 continue
             
-            # CRITICAL: Enforce date boundary (no cross-date leakage)
-            if selected_date is not None:
-                # Only consider reservations on the selected date
-                if res_start.date() != selected_date:
-                    continue
-            
-            res_end = calculate_reservation_end(res_start)
             table_num = res["table_number"]
-            res_dict = dict(res)  # Copy for storage
             
-            if selected_time is not None:
-                # Specific time selected - check occupancy at that time
-                selected_naive = selected_time.replace(tzinfo=None)
-                
-                # Check if occupied at selected time
-                if is_reservation_ongoing(res_start, res_end, selected_naive):
-                    occupied_tables[table_num] = (res_start, res_dict)
-                # Check if soon occupied (only if not already occupied)
-                elif table_num not in occupied_tables:
-                    if is_reservation_soon(res_start, selected_naive, threshold_minutes=30):
-                        soon_tables[table_num] = (res_start, res_dict)
+            if selected_time is None or res_start <= selected_time:
+                # Future reservation, or (inside the window) ongoing at the selected time
+                code = _OCCUPIED
+                if states[table_num] != _OCCUPIED:
+                    occupied_count += 1
+            elif states[table_num] == _OCCUPIED:
+                # Starting soon, but the table is already occupied
+                continue
             else:
-                # No specific time - show future reservations (within selected date)
-                now = get_current_sofia_time().replace(tzinfo=None)
-                if res_start >= now:
-                    occupied_tables[table_num] = (res_start, res_dict)
-        
-        # Update table states
-        for table_num, (res_start, res_dict) in occupied_tables.items():
-            info = res_dict if include_reservation_data else res_start
-            table_states[table_num] = (TableState.OCCUPIED, info)
+                code = _SOON_30
+            
+            states[table_num] = code
+            res_dict = dict(res) if include_reservation_data else None  # Copy for storage
+            table_states[table_num] = make_state(_STATE_BY_CODE[code], res_start, res_dict)
+            
+            # Reservations on a table never overlap, so once every table is
+            # occupied at the selected time the remaining rows can't change anything
+            if selected_time is not None and occupied_count == size - 1:
+                break
         
-        for table_num, (res_start, res_dict) in soon_tables.items():
-            # Only mark as SOON if not already OCCUPIED
-            if table_states[table_num][0] == TableState.FREE:
-                info = res_dict if include_reservation_data else res_start
-                table_states[table_num] = (TableState.SOON_30, info)
+        self._states_cache[cache_key] = table_states
+        if len(self._states_cache) > _STATES_CACHE_SIZE:
+            self._states_cache.popitem(last=False)
         
         return table_states
 
@@ -9,13 +9,23 @@ in the system originates from user input (already local time) and is stored/comp
 consistently without crossing timezone boundaries.
 """
 
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
 # Constants
 SOFIA_TIMEZONE = "Europe/Sofia"  # kept for reference only — not used at runtime
 TIME_SLOT_FORMAT = "%Y-%m-%d %H:%M"
 RESERVATION_DURATION_MINUTES = 90  # 1 hour 30 minutes
+# Built once; adding a ready timedelta is cheaper than constructing one per row
+RESERVATION_DURATION = timedelta(minutes=RESERVATION_DURATION_MINUTES)
+
+# How long a get_current_sofia_time() reading is reused
+_NOW_TTL_SECONDS = 1.0
+
+# (monotonic time of the reading, datetime returned)
+_now_cache = (float("-inf"), None)
 
 
 def get_current_sofia_time() -> datetime:
@@ -26,16 +36,29 @@ def get_current_sofia_time() -> datetime:
     Android's bundled Python runtime. Returns naive local time instead — all
     datetimes in the system are naive and compared consistently.
 
+    A reading is reused for up to a second, so bursts of UI refreshes
+    don't each hit the clock.
+
     Returns:
         Naive datetime representing current local time
     """
-    return datetime.now()
+    global _now_cache
+    stamp, now = _now_cache
+    mono = time.monotonic()
+    if mono - stamp >= _NOW_TTL_SECONDS:
+        now = datetime.now()
+        _now_cache = (mono, now)
+    return now
 
 
+@lru_cache(maxsize=4096)
 def parse_time_slot(time_slot: str) -> Optional[datetime]:
     """
     Parse time slot string to naive datetime (assumes Europe/Sofia local time).
 
+    Results are memoized - the same slot strings are parsed on every
+    refresh, and datetimes are immutable so sharing them is safe.
+
     Args:
         time_slot: Time string in format "YYYY-MM-DD HH:MM"
 
@@ -43,6 +66,15 @@ def parse_time_slot(time_slot: str) -> Optional[datetime]:
         Naive datetime or None if parsing fails
     """
     try:
+        # Fast path for the canonical zero-padded form: slice the fixed
+        # fields instead of running strptime's format machinery
+        if (len(time_slot) == 16 and time_slot[4] == "-" and time_slot[7] == "-"
+                and time_slot[10] == " " and time_slot[13] == ":"):
+            fields = (time_slot[0:4], time_slot[5:7], time_slot[8:10],
+                      time_slot[11:13], time_slot[14:16])
+            if "".join(fields).isdigit():
+                return datetime(*map(int, fields))
+        # strptime also accepts non-padded fields - keep that for old data
         return datetime.strptime(time_slot, TIME_SLOT_FORMAT)
     except (ValueError, TypeError):
         return None
@@ -100,7 +132,7 @@ def calculate_reservation_end(start: datetime) -> datetime:
     Returns:
         End time (same timezone awareness as input)
     """
-    return start + timedelta(minutes=RESERVATION_DURATION_MINUTES)
+    return start + RESERVATION_DURATION
 
 
 def is_reservation_ongoing(
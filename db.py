@@ -1,11 +1,17 @@
 import sqlite3
 import os
 import shutil
-from datetime import datetime, timedelta
+import threading
+import weakref
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from itertools import groupby
+from operator import itemgetter
 
 # Import storage utilities for cross-platform path handling
 try:
     from core.storage import get_database_path, is_mobile, is_first_run
+    from core.time_utils import parse_time_slot, format_time_slot, RESERVATION_DURATION
 except ImportError:
     # Fallback for when running without core module (shouldn't happen)
     def get_database_path(db_name):
@@ -14,14 +20,170 @@ except ImportError:
         return False
     def is_first_run():
         return False
+    def parse_time_slot(time_slot):
+        try:
+            return datetime.strptime(time_slot, "%Y-%m-%d %H:%M")
+        except (ValueError, TypeError):
+            return None
+    def format_time_slot(dt):
+        return dt.strftime("%Y-%m-%d %H:%M")
+    RESERVATION_DURATION = timedelta(hours=1, minutes=30)
+
+
+# -------------------------
+# Schema
+# -------------------------
+# {name} is filled in so the same definition can build a replacement table
+# while migrating an older layout
+_SQL_CREATE_SECTION_TABLES = """
+    CREATE TABLE IF NOT EXISTS {name} (
+        table_number INTEGER PRIMARY KEY,
+        section_id INTEGER NOT NULL,
+        FOREIGN KEY(section_id) REFERENCES sections(id) ON DELETE CASCADE
+    ) WITHOUT ROWID
+"""
+
+# Current local time as "YYYY-MM-DD HH:MM:SS" (what datetime.now() gave),
+# evaluated by SQLite inside the INSERT
+_SQL_LOCAL_NOW = "strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')"
+
+# -------------------------
+# Reservation SQL
+# -------------------------
+# Hot-path statements are kept as module constants so each call passes the
+# same string object to sqlite3 (whose statement cache is keyed on the SQL
+# text) and no query text is rebuilt per call.
+
+# Reservation columns in the order of core.reservation_service.Reservation,
+# so rows map onto it positionally whatever columns the table gains later
+_RESERVATION_COLUMNS = (
+    "id, table_number, time_slot, customer_name, phone_number, "
+    "additional_info, waiter_id, status"
+)
+
+_SQL_INSERT_RESERVATION = """
+    INSERT INTO reservations
+    (table_number, time_slot, customer_name, phone_number, additional_info, waiter_id, status)
+    VALUES (?, ?, ?, ?, ?, ?, 'Reserved')
+"""
+
+_SQL_UPDATE_RESERVATION = """
+    UPDATE reservations
+    SET table_number = ?,
+        time_slot = ?,
+        customer_name = ?,
+        phone_number = ?,
+        additional_info = ?,
+        waiter_id = ?,
+        status = ?
+    WHERE id = ?
+"""
+
+_SQL_CANCEL_RESERVATION = "UPDATE reservations SET status = 'Cancelled' WHERE id = ?"
+
+_SQL_GET_BOOKING = "SELECT status, table_number, time_slot FROM reservations WHERE id = ?"
+
+_SQL_GET_RESERVATION = f"SELECT {_RESERVATION_COLUMNS} FROM reservations WHERE id = ?"
+
+# Starts strictly inside (start - 1h30, start + 1h30) on one table
+_SQL_OVERLAP = """
+    SELECT 1 FROM reservations
+    WHERE table_number = ? AND status = 'Reserved'
+    AND time_slot > ? AND time_slot < ?
+    LIMIT 1
+"""
+
+_SQL_OVERLAP_EXCLUDING = """
+    SELECT 1 FROM reservations
+    WHERE table_number = ? AND status = 'Reserved'
+    AND time_slot > ? AND time_slot < ? AND id != ?
+    LIMIT 1
+"""
+
+_SQL_RESERVATIONS_BETWEEN = (
+    f"SELECT {_RESERVATION_COLUMNS} FROM reservations WHERE time_slot >= ? AND time_slot < ?"
+)
+
+# -------------------------
+# Order, shift and table SQL
+# -------------------------
+_SQL_INSERT_ORDER = (
+    "INSERT INTO orders (table_number, order_details, waiter_id, timestamp) "
+    f"VALUES (?, ?, ?, {_SQL_LOCAL_NOW})"
+)
+
+_SQL_INSERT_SHIFT = f"INSERT INTO shifts (waiter_id, shift_date) VALUES (?, {_SQL_LOCAL_NOW})"
+
+_SQL_GET_TABLE_SHAPE = "SELECT shape FROM tables_metadata WHERE table_number = ?"
+
+# Prepared statements kept per connection (sqlite3 default: 128). Pooled
+# connections live for their thread, so every distinct statement DBManager
+# runs stays compiled instead of being evicted and re-prepared.
+_STATEMENT_CACHE_SIZE = 256
+
+
+class _PooledConnection:
+    """
+    Handle to a thread's pooled DBManager connection.
+    
+    Methods still close() the connection they get from _get_connection();
+    for a pooled handle that releases it back to its thread instead,
+    rolling back anything left uncommitted just like a real close would.
+    """
+    
+    def __init__(self, conn):
+        self._conn = conn
+    
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+    
+    def __enter__(self):
+        self._conn.__enter__()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        return self._conn.__exit__(exc_type, exc, tb)
+    
+    def close(self):
+        if self._conn.in_transaction:
+            self._conn.rollback()
+
+
+class _BulkConnection:
+    """
+    Handle to the connection owned by an active DBManager.bulk() block.
+    
+    Write methods commit and close the connection they get from
+    _get_connection(); inside a bulk block those calls become no-ops so
+    the statements join the surrounding transaction instead.
+    """
+    
+    def __init__(self, conn):
+        self._conn = conn
+    
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        return False
+    
+    def commit(self):
+        pass
+    
+    def close(self):
+        pass
 
 
 class DBManager:
     """
-    Thread-safe database manager using per-call connections.
+    Thread-safe database manager using one pooled connection per thread.
     
-    Each method opens its own connection to avoid SQLite threading issues
-    with Flet's multi-threaded event handlers.
+    Each thread lazily opens its own connection and reuses it for every
+    call, avoiding SQLite threading issues with Flet's multi-threaded
+    event handlers without reopening the database file on each query.
     
     On mobile (Android/iOS), automatically uses app storage directory.
     Handles first-run initialization with default data seeding.
@@ -31,6 +193,31 @@ class DBManager:
         # Use cross-platform storage path for database
         self.db_name = get_database_path(db_name)
         
+        # Bumped on every reservation write (and re-initialization after a
+        # restore) so services can tell when cached results are stale
+        self.reservations_version = 0
+        
+        # ("YYYY-MM-DD", status or None for all) -> that day's reservation
+        # rows, built on demand by get_reservations_on_date and dropped on
+        # every reservation write
+        self._by_date = None
+        
+        # (rows, rows by id) for the waiters table, loaded on first use and
+        # dropped by every waiter write; waiters_version guards against
+        # publishing a load a concurrent write has already outdated
+        self.waiters_version = 0
+        self._waiters = None
+        
+        # Per-thread state: the thread's pooled connection (and the pool
+        # generation it was opened in), plus an active bulk() block's one
+        self._local = threading.local()
+        
+        # Every live pooled handle, so close() can tear them all down; held
+        # weakly so a finished thread's connection is freed with its locals
+        self._pool = weakref.WeakSet()
+        self._pool_lock = threading.Lock()
+        self._pool_generation = 0
+        
         # Check if database file exists before initialization
         db_exists = os.path.exists(self.db_name)
         
@@ -46,24 +233,120 @@ class DBManager:
         if not db_exists:
             print("[DB] Database initialized with default tables and sections")
     
-    def _get_connection(self):
+    def _open_connection(self):
         """
         Create a new database connection with proper settings.
         
         Returns a connection configured with:
         - row_factory = sqlite3.Row for dict-like access
         - Foreign keys enabled
+        - synchronous = NORMAL (safe with WAL, one fsync per checkpoint
+          instead of two per commit)
+        - Temporary tables/indices kept in memory
+        - A statement cache large enough for every DBManager query
         """
-        conn = sqlite3.connect(self.db_name, check_same_thread=False)
+        conn = sqlite3.connect(
+            self.db_name, check_same_thread=False, cached_statements=_STATEMENT_CACHE_SIZE
+        )
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
         return conn
     
+    def _get_connection(self):
+        """
+        Get this thread's pooled connection, opening it on first use.
+        
+        Callers close() it when done, which only rolls back uncommitted
+        work; the handle stays open for the thread's next call. Inside a
+        bulk() block on this thread, returns the block's shared connection
+        instead (commit/close deferred to the block).
+        """
+        local = self._local
+        bulk_conn = getattr(local, "bulk_conn", None)
+        if bulk_conn is not None:
+            return _BulkConnection(bulk_conn)
+        pooled = getattr(local, "conn", None)
+        if pooled is None or local.generation != self._pool_generation:
+            # First call on this thread, or the pool was torn down by close()
+            pooled = _PooledConnection(self._open_connection())
+            with self._pool_lock:
+                self._pool.add(pooled)
+            local.conn = pooled
+            local.generation = self._pool_generation
+        return pooled
+    
+    @contextmanager
+    def bulk(self):
+        """
+        Run several write methods as one transaction.
+        
+        Every DBManager call made on this thread inside the block shares one
+        connection; the transaction commits once when the block exits and
+        rolls back if it raises. Nested blocks join the outer one.
+        
+        Example:
+            with db.bulk():
+                section_id = db.create_section(name)
+                db.assign_tables_to_section(section_id, tables)
+        """
+        if getattr(self._local, "bulk_conn", None) is not None:
+            yield
+            return
+        conn = self._get_connection()
+        conn.execute("BEGIN IMMEDIATE")
+        self._local.bulk_conn = conn
+        try:
+            yield
+            conn.commit()
+            # Write methods inside the block invalidated before this commit;
+            # a concurrent reader may have re-cached the pre-commit state since
+            self._reservations_changed()
+            self._waiters_changed()
+        except BaseException:
+            conn.rollback()
+            # Cached data may reflect the rolled-back writes
+            self._reservations_changed()
+            self._waiters_changed()
+            raise
+        finally:
+            self._local.bulk_conn = None
+            conn.close()
+    
+    def checkpoint_wal(self):
+        """
+        Flush the write-ahead log into the main database file.
+        
+        Call before copying or replacing the database file directly, so the
+        copy is complete and no stale -wal file is left behind.
+        """
+        conn = self._get_connection()
+        try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        finally:
+            conn.close()
+    
+    def _reservations_changed(self):
+        """Mark cached reservation data (version, per-date index) as stale."""
+        self.reservations_version += 1
+        self._by_date = None
+    
+    def _waiters_changed(self):
+        """Drop the cached waiter rows."""
+        self.waiters_version += 1
+        self._waiters = None
+    
     def initialize_db(self):
         """Create the tables if they do not exist yet."""
+        self._reservations_changed()
+        self._waiters_changed()
         conn = self._get_connection()
         try:
             cursor = conn.cursor()
+            # WAL is persistent in the database file, so setting it once here
+            # covers every later connection
+            cursor.execute("PRAGMA journal_mode = WAL")
             # Create waiters table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS waiters (
@@ -85,6 +368,18 @@ class DBManager:
                     FOREIGN KEY(waiter_id) REFERENCES waiters(id)
                 )
             ''')
+            # Date-scoped reservation queries range-scan time_slot
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_res_time ON reservations(time_slot, status, table_number)"
+            )
+            # Overlap checks seek one table's "Reserved" slots by range. The
+            # index is covering for them: id is the rowid, which every index
+            # entry already carries, so `id != ?` needs no table lookup
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_res_table_status_slot "
+                "ON reservations(table_number, status, time_slot)"
+            )
+            self._normalize_time_slots(cursor)
             # Create orders table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS orders (
@@ -113,16 +408,10 @@ class DBManager:
                     display_order INTEGER DEFAULT 0
                 )
             ''')
-            # Create section_tables junction table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS section_tables (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    section_id INTEGER NOT NULL,
-                    table_number INTEGER NOT NULL,
-                    FOREIGN KEY(section_id) REFERENCES sections(id) ON DELETE CASCADE,
-                    UNIQUE(table_number)
-                )
-            ''')
+            # Create section_tables junction table (a table belongs to at most
+            # one section, so table_number is the key; no separate rowid)
+            cursor.execute(_SQL_CREATE_SECTION_TABLES.format(name="section_tables"))
+            self._migrate_section_tables(cursor)
             # Create tables metadata table for shapes
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS tables_metadata (
@@ -130,6 +419,13 @@ class DBManager:
                     shape TEXT NOT NULL DEFAULT 'RECTANGLE'
                 )
             ''')
+            # Index the foreign keys (waiter deletes, per-waiter and
+            # per-section lookups). The reservation (table_number, status)
+            # and time_slot lookups are served by the composite indexes above.
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_res_waiter ON reservations(waiter_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_orders_waiter_ts ON orders(waiter_id, timestamp)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_shifts_waiter_date ON shifts(waiter_id, shift_date)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_section_tables_section ON section_tables(section_id)")
             conn.commit()
             
             # Initialize default sections if none exist
@@ -139,6 +435,48 @@ class DBManager:
         finally:
             conn.close()
     
+    def _normalize_time_slots(self, cursor):
+        """
+        Rewrite stored time slots that aren't zero-padded "YYYY-MM-DD HH:MM".
+        
+        Older versions stored slots as entered (e.g. "2026-10-17 9:00"), but
+        the overlap check and date queries compare time_slot strings, which
+        only orders correctly for the canonical form. Unparseable slots are
+        left untouched.
+        """
+        cursor.execute(
+            "SELECT id, time_slot FROM reservations WHERE time_slot NOT GLOB "
+            "'[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9] [0-9][0-9]:[0-9][0-9]'"
+        )
+        fixes = []
+        for reservation_id, time_slot in cursor.fetchall():
+            start = parse_time_slot(time_slot)
+            if start is not None:
+                fixes.append((format_time_slot(start), reservation_id))
+        if fixes:
+            cursor.executemany("UPDATE reservations SET time_slot = ? WHERE id = ?", fixes)
+    
+    def _migrate_section_tables(self, cursor):
+        """
+        Rebuild a section_tables table from the old rowid layout.
+        
+        Older databases keyed it by an AUTOINCREMENT id with a separate
+        UNIQUE(table_number) index; nothing references that id, so the rows
+        are copied into the WITHOUT ROWID layout keyed by table_number.
+        """
+        cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'section_tables'")
+        row = cursor.fetchone()
+        if row is None or "WITHOUT ROWID" in row[0].upper():
+            return
+        cursor.execute("DROP TABLE IF EXISTS section_tables_new")
+        cursor.execute(_SQL_CREATE_SECTION_TABLES.format(name="section_tables_new"))
+        cursor.execute(
+            "INSERT INTO section_tables_new (section_id, table_number) "
+            "SELECT section_id, table_number FROM section_tables"
+        )
+        cursor.execute("DROP TABLE section_tables")
+        cursor.execute("ALTER TABLE section_tables_new RENAME TO section_tables")
+    
     # -------------------------
     # Waiter management methods
     # -------------------------
@@ -148,6 +486,7 @@ class DBManager:
             cursor = conn.cursor()
             cursor.execute("INSERT INTO waiters (name) VALUES (?)", (name,))
             conn.commit()
+            self._waiters_changed()
         finally:
             conn.close()
     
@@ -157,6 +496,7 @@ class DBManager:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM waiters WHERE id = ?", (waiter_id,))
             conn.commit()
+            self._waiters_changed()
         finally:
             conn.close()
     
@@ -166,25 +506,38 @@ class DBManager:
             cursor = conn.cursor()
             cursor.execute("UPDATE waiters SET name = ? WHERE id = ?", (new_name, waiter_id))
             conn.commit()
+            self._waiters_changed()
         finally:
             conn.close()
     
+    def _load_waiters(self):
+        """Return the cached (rows, rows by id), reading the table if needed."""
+        cached = self._waiters
+        if cached is None:
+            version = self.waiters_version
+            conn = self._get_connection()
+            try:
+                rows = conn.execute("SELECT id, name FROM waiters").fetchall()
+            finally:
+                conn.close()
+            cached = (rows, {row["id"]: row for row in rows})
+            if version == self.waiters_version:
+                self._waiters = cached
+        return cached
+    
     def get_waiters(self):
-        conn = self._get_connection()
-        try:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM waiters")
-            return cursor.fetchall()
-        finally:
-            conn.close()
+        """Get all waiters (served from memory until a waiter changes)."""
+        return list(self._load_waiters()[0])
+    
+    def get_waiter(self, waiter_id):
+        """Get a single waiter row by ID (None if not found)."""
+        return self._load_waiters()[1].get(waiter_id)
     
     def check_in_waiter(self, waiter_id):
         """Record a check‐in entry for a waiter for the current shift."""
         conn = self._get_connection()
         try:
-            cursor = conn.cursor()
-            shift_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            cursor.execute("INSERT INTO shifts (waiter_id, shift_date) VALUES (?, ?)", (waiter_id, shift_date))
+            conn.execute(_SQL_INSERT_SHIFT, (waiter_id,))
             conn.commit()
         finally:
             conn.close()
@@ -206,55 +559,56 @@ class DBManager:
         time_slot is a string in format "YYYY-MM-DD HH:MM".
         We block 1 hour and 30 minutes from the start time.
         """
-        # Parse the new reservation start time
-        try:
-            new_start = datetime.strptime(time_slot, "%Y-%m-%d %H:%M")
-        except ValueError:
+        # Parse the new reservation start time (memoized fast-path parser)
+        new_start = parse_time_slot(time_slot)
+        if new_start is None:
             # If the time format is invalid, handle the error
             return False
-
-        new_end = new_start + timedelta(hours=1, minutes=30)
+        # Store the canonical zero-padded form - overlap checks and date
+        # queries compare time_slot strings
+        time_slot = format_time_slot(new_start)
 
         conn = self._get_connection()
         try:
-            cursor = conn.cursor()
-
-            # Fetch existing "Reserved" reservations for this table
-            cursor.execute(
-                "SELECT time_slot FROM reservations WHERE table_number = ? AND status = 'Reserved'",
-                (table_number,)
-            )
-            existing_reservations = cursor.fetchall()
-
-            # Check for overlap with each existing reservation
-            for row in existing_reservations:
-                existing_slot = row["time_slot"]
-                try:
-                    existing_start = datetime.strptime(existing_slot, "%Y-%m-%d %H:%M")
-                except ValueError:
-                    continue  # skip malformed data, or handle as needed
-
-                existing_end = existing_start + timedelta(hours=1, minutes=30)
-
-                # Overlap condition:
-                # Two intervals [new_start, new_end) and [existing_start, existing_end)
-                # overlap if new_start < existing_end and existing_start < new_end
-                if (new_start < existing_end) and (existing_start < new_end):
-                    # Found an overlap -> double booking
-                    return False
+            if self._has_overlap(conn, table_number, new_start):
+                # Found an overlap -> double booking
+                return False
 
             # If we reach here, no overlap found. Proceed to insert the reservation.
-            cursor.execute(
-                """INSERT INTO reservations 
-                (table_number, time_slot, customer_name, phone_number, additional_info, waiter_id, status) 
-                VALUES (?, ?, ?, ?, ?, ?, 'Reserved')""",
+            conn.execute(
+                _SQL_INSERT_RESERVATION,
                 (table_number, time_slot, customer_name, phone_number, additional_info, waiter_id)
             )
             conn.commit()
+            self._reservations_changed()
             return True
         finally:
             conn.close()
     
+    def _has_overlap(self, conn, table_number, new_start, exclude_id=None):
+        """
+        Check whether a "Reserved" reservation on the table overlaps one
+        starting at new_start.
+        
+        Two 1h30 reservations overlap iff their starts are less than 1h30
+        apart, and "YYYY-MM-DD HH:MM" strings compare chronologically, so
+        this is a single range seek on idx_res_table_status_slot.
+        
+        Every reservation has the same length, so no end time is stored:
+        an end column would only allow `time_slot < ? AND end > ?`, which
+        bounds the index range on one side and scans the table's history.
+        """
+        block = RESERVATION_DURATION
+        lower = (new_start - block).strftime("%Y-%m-%d %H:%M")
+        upper = (new_start + block).strftime("%Y-%m-%d %H:%M")
+        if exclude_id is None:
+            row = conn.execute(_SQL_OVERLAP, (table_number, lower, upper)).fetchone()
+        else:
+            row = conn.execute(
+                _SQL_OVERLAP_EXCLUDING, (table_number, lower, upper, exclude_id)
+            ).fetchone()
+        return row is not None
+    
     def update_reservation(self, reservation_id, table_number, time_slot, customer_name,
                            phone_number, additional_info, waiter_id, status):
         """
@@ -263,54 +617,29 @@ class DBManager:
         2. Update phone_number and additional_info as well.
         """
         # 1) Parse the new time_slot if user changed it
-        try:
-            new_start = datetime.strptime(time_slot, "%Y-%m-%d %H:%M")
-            new_end = new_start + timedelta(hours=1, minutes=30)
-        except ValueError:
+        new_start = parse_time_slot(time_slot)
+        if new_start is None:
             # If invalid date/time format, handle as needed
             return False
+        time_slot = format_time_slot(new_start)
 
         conn = self._get_connection()
         try:
-            cursor = conn.cursor()
-
-            # 2) Check for overlap with other reservations (if still 'Reserved')
+            # 2) Check for overlap with other reservations (if still 'Reserved').
+            # An already-Reserved booking keeping its table and time can't
+            # create a new conflict (e.g. only notes or phone were edited)
             if status == "Reserved":
-                cursor.execute("""
-                    SELECT id, time_slot
-                    FROM reservations
-                    WHERE table_number = ?
-                    AND status = 'Reserved'
-                    AND id != ?
-                """, (table_number, reservation_id))
-                existing = cursor.fetchall()
-
-                for row in existing:
-                    try:
-                        existing_start = datetime.strptime(row["time_slot"], "%Y-%m-%d %H:%M")
-                    except ValueError:
-                        continue
-                    existing_end = existing_start + timedelta(hours=1, minutes=30)
-
-                    # Overlap check: [new_start, new_end) vs [existing_start, existing_end)
-                    if (new_start < existing_end) and (existing_start < new_end):
-                        # Found overlap => double booking
-                        return False
+                current = conn.execute(_SQL_GET_BOOKING, (reservation_id,)).fetchone()
+                unchanged = current is not None and tuple(current) == ("Reserved", table_number, time_slot)
+                if not unchanged and self._has_overlap(conn, table_number, new_start, reservation_id):
+                    # Found overlap => double booking
+                    return False
 
             # 3) Proceed with the update
-            cursor.execute('''
-                UPDATE reservations
-                SET table_number = ?,
-                    time_slot = ?,
-                    customer_name = ?,
-                    phone_number = ?,
-                    additional_info = ?,
-                    waiter_id = ?,
-                    status = ?
-                WHERE id = ?
-            ''', (table_number, time_slot, customer_name, phone_number, additional_info,
+            conn.execute(_SQL_UPDATE_RESERVATION, (table_number, time_slot, customer_name, phone_number, additional_info,
                   waiter_id, status, reservation_id))
             conn.commit()
+            self._reservations_changed()
             return True
         finally:
             conn.close()
@@ -322,9 +651,9 @@ class DBManager:
         """
         conn = self._get_connection()
         try:
-            cursor = conn.cursor()
-            cursor.execute("UPDATE reservations SET status = 'Cancelled' WHERE id = ?", (reservation_id,))
+            conn.execute(_SQL_CANCEL_RESERVATION, (reservation_id,))
             conn.commit()
+            self._reservations_changed()
         finally:
             conn.close()
     
@@ -332,7 +661,92 @@ class DBManager:
         conn = self._get_connection()
         try:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM reservations")
+            cursor.execute(f"SELECT {_RESERVATION_COLUMNS} FROM reservations")
+            return cursor.fetchall()
+        finally:
+            conn.close()
+    
+    def get_reservation_time_slots(self):
+        """
+        Get just the time_slot of every reservation (for statistics).
+        
+        Answered from a covering index instead of the full rows with their
+        customer and note fields.
+        """
+        conn = self._get_connection()
+        try:
+            return conn.execute("SELECT time_slot FROM reservations").fetchall()
+        finally:
+            conn.close()
+    
+    def get_reservation(self, reservation_id):
+        """Get a single reservation row by ID (None if not found)."""
+        conn = self._get_connection()
+        try:
+            return conn.execute(_SQL_GET_RESERVATION, (reservation_id,)).fetchone()
+        finally:
+            conn.close()
+    
+    def get_reservations_on_date(self, day, status=None):
+        """
+        Get the reservations starting on a date, ordered by time_slot.
+        
+        Served from an in-memory index by date and status that is built from
+        one full read and dropped on every reservation write, so callers
+        don't compare status strings per row.
+        
+        Args:
+            day: date (or datetime) to get reservations for
+            status: Only reservations with this status, or None for all
+        """
+        index = self._by_date
+        if index is None:
+            version = self.reservations_version
+            index = {}
+            for row in self.query_reservations():
+                day_key = row["time_slot"][:10]
+                index.setdefault((day_key, None), []).append(row)
+                index.setdefault((day_key, row["status"]), []).append(row)
+            # Don't publish an index a concurrent write has already outdated
+            if version == self.reservations_version:
+                self._by_date = index
+        return list(index.get((day.strftime("%Y-%m-%d"), status), ()))
+    
+    def query_reservations(self, date_prefix=None, status=None, table_number=None):
+        """
+        Get reservations matching the given filters, ordered by time_slot.
+        
+        time_slot is "YYYY-MM-DD HH:MM", so string order is chronological
+        and a date is a key prefix - both are served by idx_res_time.
+        
+        Args:
+            date_prefix: Only reservations whose time_slot starts with this
+                (e.g. "YYYY-MM-DD"), or None for all dates
+            status: Only reservations with this status, or None for all
+            table_number: Only reservations for this table, or None for all
+        """
+        clauses = []
+        params = []
+        if date_prefix:
+            # Prefix match as a range: [prefix, prefix with last char bumped)
+            clauses.append("time_slot >= ? AND time_slot < ?")
+            params += [date_prefix, date_prefix[:-1] + chr(ord(date_prefix[-1]) + 1)]
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        if table_number is not None:
+            clauses.append("table_number = ?")
+            params.append(table_number)
+        
+        query = f"SELECT {_RESERVATION_COLUMNS} FROM reservations"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY time_slot, id"
+        
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
             return cursor.fetchall()
         finally:
             conn.close()
@@ -343,12 +757,7 @@ class DBManager:
     def create_order(self, table_number, order_details, waiter_id):
         conn = self._get_connection()
         try:
-            cursor = conn.cursor()
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            cursor.execute(
-                "INSERT INTO orders (table_number, order_details, waiter_id, timestamp) VALUES (?, ?, ?, ?)",
-                (table_number, order_details, waiter_id, timestamp)
-            )
+            conn.execute(_SQL_INSERT_ORDER, (table_number, order_details, waiter_id))
             conn.commit()
         finally:
             conn.close()
@@ -370,18 +779,27 @@ class DBManager:
         Generate a simple report based on the reservation time slots.
         period: 'daily', 'weekly', or 'monthly'
         """
+        # Bounds are computed here and compared against the raw time_slot
+        # column, so the query can range-seek idx_res_time instead of
+        # evaluating date()/strftime() on every row
+        today = date.today()
+        if period == 'daily':
+            start, end = today, today + timedelta(days=1)
+        elif period == 'weekly':
+            # Monday-based week, like strftime('%W')
+            start = today - timedelta(days=today.weekday())
+            end = start + timedelta(days=7)
+        elif period == 'monthly':
+            start = today.replace(day=1)
+            end = (start + timedelta(days=32)).replace(day=1)
+        else:
+            return []
+        
         conn = self._get_connection()
         try:
-            cursor = conn.cursor()
-            if period == 'daily':
-                cursor.execute("SELECT * FROM reservations WHERE date(time_slot)=date('now')")
-            elif period == 'weekly':
-                cursor.execute("SELECT * FROM reservations WHERE strftime('%W', time_slot)=strftime('%W','now')")
-            elif period == 'monthly':
-                cursor.execute("SELECT * FROM reservations WHERE strftime('%m', time_slot)=strftime('%m','now')")
-            else:
-                return []
-            return cursor.fetchall()
+            return conn.execute(
+                _SQL_RESERVATIONS_BETWEEN, (start.isoformat(), end.isoformat())
+            ).fetchall()
         finally:
             conn.close()
     
@@ -389,9 +807,24 @@ class DBManager:
     # Backup & Restore
     # -------------------------
     def backup_database(self, backup_file='backup.db'):
-        """Back up the database to a file using file copy (thread-safe)."""
-        # Use shutil for file-based copy (no connection needed)
-        shutil.copy2(self.db_name, backup_file)
+        """
+        Back up the database to a file with SQLite's online backup API.
+        
+        The copy is a consistent snapshot that includes changes still in the
+        WAL. It runs in one step: in WAL mode the read it holds doesn't block
+        writers on other connections, whereas a stepped copy would restart
+        whenever one of them commits mid-backup.
+        """
+        src = self._get_connection()
+        try:
+            # Autocommit: no implicit transaction on the destination
+            dst = sqlite3.connect(backup_file, isolation_level=None)
+            try:
+                src.backup(dst, pages=-1)
+            finally:
+                dst.close()
+        finally:
+            src.close()
         return backup_file
     
     def restore_database(self, backup_file='backup.db'):
@@ -400,14 +833,25 @@ class DBManager:
             raise FileNotFoundError(f"Backup file not found: {backup_file}")
         
         # Simply copy the backup file over the current database
+        self.checkpoint_wal()
+        self.close()
         shutil.copy2(backup_file, self.db_name)
         
         # Reinitialize to ensure schema is up to date
         self.initialize_db()
     
     def close(self):
-        """No-op for compatibility - connections are closed after each operation."""
-        pass
+        """
+        Close every pooled connection.
+        
+        Threads transparently reopen on their next call. Also used before the
+        database file is replaced, so no handle keeps the old file open.
+        """
+        with self._pool_lock:
+            self._pool_generation += 1
+            pooled, self._pool = list(self._pool), weakref.WeakSet()
+        for handle in pooled:
+            handle._conn.close()
     
     # -------------------------
     # Section management
@@ -430,11 +874,10 @@ class DBManager:
                     (name, order)
                 )
                 section_id = cursor.lastrowid
-                for table_num in tables:
-                    cursor.execute(
-                        "INSERT INTO section_tables (section_id, table_number) VALUES (?, ?)",
-                        (section_id, table_num)
-                    )
+                cursor.executemany(
+                    "INSERT INTO section_tables (section_id, table_number) VALUES (?, ?)",
+                    [(section_id, table_num) for table_num in tables]
+                )
             conn.commit()
     
     def get_sections(self):
@@ -458,41 +901,55 @@ class DBManager:
             conn.close()
     
     def get_section_tables(self, section_id):
-        """Get all table numbers assigned to a section."""
+        """
+        Get all table numbers assigned to a section.
+        
+        For more than one section use get_all_section_tables(), which loads
+        every section with its tables in a single query.
+        """
         conn = self._get_connection()
         try:
             cursor = conn.cursor()
+            cursor.row_factory = None  # Plain tuples - only one field is read
             cursor.execute(
                 "SELECT table_number FROM section_tables WHERE section_id = ? ORDER BY table_number",
                 (section_id,)
             )
-            return [row["table_number"] for row in cursor.fetchall()]
+            return [table_number for (table_number,) in cursor.fetchall()]
         finally:
             conn.close()
     
     def get_all_section_tables(self):
-        """Get all sections with their table assignments."""
+        """
+        Get all sections with their table assignments.
+        
+        One LEFT JOIN query for all sections (no per-section lookups).
+        
+        Returns:
+            List of {"id", "name", "display_order", "tables"} dicts ordered by
+            display_order, with "tables" a sorted list of table numbers
+        """
         conn = self._get_connection()
         try:
             cursor = conn.cursor()
+            # Plain tuples: rows are unpacked positionally, no sqlite3.Row needed
+            cursor.row_factory = None
+            # One row per (section, table); sections without tables come
+            # back once with a NULL table_number
             cursor.execute("""
-                SELECT s.id, s.name, s.display_order, 
-                       GROUP_CONCAT(st.table_number) as tables
+                SELECT s.id, s.name, s.display_order, st.table_number
                 FROM sections s
                 LEFT JOIN section_tables st ON s.id = st.section_id
-                GROUP BY s.id
-                ORDER BY s.display_order
+                ORDER BY s.display_order, s.id, st.table_number
             """)
             result = []
-            for row in cursor.fetchall():
-                tables = []
-                if row["tables"]:
-                    tables = [int(t) for t in row["tables"].split(",")]
+            for (section_id, name, display_order), rows in groupby(
+                    cursor.fetchall(), key=itemgetter(0, 1, 2)):
                 result.append({
-                    "id": row["id"],
-                    "name": row["name"],
-                    "display_order": row["display_order"],
-                    "tables": sorted(tables)
+                    "id": section_id,
+                    "name": name,
+                    "display_order": display_order,
+                    "tables": [row[3] for row in rows if row[3] is not None]
                 })
             return result
         finally:
@@ -551,21 +1008,26 @@ class DBManager:
         Assign tables to a section (replaces existing assignments).
         Tables are removed from other sections before assignment.
         """
+        table_numbers = list(table_numbers)
         conn = self._get_connection()
         try:
-            cursor = conn.cursor()
-            # Remove tables from all sections first
-            for table_num in table_numbers:
-                cursor.execute("DELETE FROM section_tables WHERE table_number = ?", (table_num,))
-            # Remove existing tables from this section
-            cursor.execute("DELETE FROM section_tables WHERE section_id = ?", (section_id,))
-            # Add new table assignments
-            for table_num in table_numbers:
-                cursor.execute(
+            # One transaction: commits on success, rolls back on error
+            with conn:
+                cursor = conn.cursor()
+                # Remove tables from all sections first
+                if table_numbers:
+                    placeholders = ",".join("?" * len(table_numbers))
+                    cursor.execute(
+                        f"DELETE FROM section_tables WHERE table_number IN ({placeholders})",
+                        table_numbers
+                    )
+                # Remove existing tables from this section
+                cursor.execute("DELETE FROM section_tables WHERE section_id = ?", (section_id,))
+                # Add new table assignments
+                cursor.executemany(
                     "INSERT INTO section_tables (section_id, table_number) VALUES (?, ?)",
-                    (section_id, table_num)
+                    [(section_id, table_num) for table_num in table_numbers]
                 )
-            conn.commit()
         finally:
             conn.close()
     
@@ -579,11 +1041,10 @@ class DBManager:
         count = cursor.fetchone()[0]
         if count == 0:
             # Create default 50 tables with RECTANGLE shape
-            for table_num in range(1, 51):
-                cursor.execute(
-                    "INSERT INTO tables_metadata (table_number, shape) VALUES (?, ?)",
-                    (table_num, "RECTANGLE")
-                )
+            cursor.executemany(
+                "INSERT INTO tables_metadata (table_number, shape) VALUES (?, ?)",
+                [(table_num, "RECTANGLE") for table_num in range(1, 51)]
+            )
             conn.commit()
     
     def get_all_tables(self):
@@ -613,9 +1074,7 @@ class DBManager:
         """Get the shape of a table (returns 'RECTANGLE' as default if not found)."""
         conn = self._get_connection()
         try:
-            cursor = conn.cursor()
-            cursor.execute("SELECT shape FROM tables_metadata WHERE table_number = ?", (table_number,))
-            row = cursor.fetchone()
+            row = conn.execute(_SQL_GET_TABLE_SHAPE, (table_number,)).fetchone()
             return row["shape"] if row else "RECTANGLE"
         finally:
             conn.close()
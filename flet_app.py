@@ -6,6 +6,8 @@ Includes internationalization support for Bulgarian, English, French, and Russia
 Works on both desktop and mobile (Android/iOS) with cross-platform storage.
 """
 
+import threading
+
 import flet as ft
 
 # Direct logcat logging for Android debugging
@@ -112,19 +114,25 @@ def _init_app(page: ft.Page):
     # ==========================================
     # Daily automatic backup on startup
     # ==========================================
-    backup_filename = backup_service.create_daily_backup_if_needed()
-    if backup_filename:
-        print(f"Daily backup created: {backup_filename}")
-    else:
-        if backup_service.has_today_backup():
-            print("Today's backup already exists.")
+    def run_startup_backup():
+        """Daily backup + cleanup; copies and fsyncs the whole DB file."""
+        backup_filename = backup_service.create_daily_backup_if_needed()
+        if backup_filename:
+            print(f"Daily backup created: {backup_filename}")
         else:
-            print("No backup created (check for errors).")
+            if backup_service.has_today_backup():
+                print("Today's backup already exists.")
+            else:
+                print("No backup created (check for errors).")
+        
+        # Clean up old backups (keep last 30)
+        deleted_count = backup_service.cleanup_old_backups(keep_count=30)
+        if deleted_count > 0:
+            print(f"Cleaned up {deleted_count} old backup(s).")
     
-    # Clean up old backups (keep last 30)
-    deleted_count = backup_service.cleanup_old_backups(keep_count=30)
-    if deleted_count > 0:
-        print(f"Cleaned up {deleted_count} old backup(s).")
+    # Off the UI path: only logs its result, and the backup reads the DB
+    # through its own connection (WAL lets the UI keep reading and writing)
+    threading.Thread(target=run_startup_backup, name="startup-backup", daemon=True).start()
     
     # Initialize application state
     app_state = AppState()
@@ -235,6 +243,11 @@ def _init_app(page: ft.Page):
             # Update page title
             page.title = t("app_title")
 
+            # Let the outgoing screen stop its background work
+            teardown, app_state.on_screen_teardown = app_state.on_screen_teardown, None
+            if teardown:
+                teardown()
+            
             # Load appropriate screen
             _lc(f"refresh_screen: creating screen content...")
             if app_state.current_screen == "reservations":
@@ -34,8 +34,8 @@ def create_reports_tab(db: DBManager, page: ft.Page):
     monthly, weekly, daily = {}, {}, {}
     
     try:
-        # Get all reservations
-        reservations = db.get_reservations()
+        # Statistics only need the time slots
+        reservations = db.get_reservation_time_slots()
         
         # Calculate statistics
         monthly, weekly, daily = get_reservations_by_period(reservations)
@@ -550,10 +550,12 @@ def create_admin_screen(
     
     # Section callbacks
     def handle_create_section(name: str, tables: List[int]) -> bool:
-        section_id = db.create_section(name)
-        if section_id:
-            if tables:
+        # Section row and its table assignments land in one transaction
+        with db.bulk():
+            section_id = db.create_section(name)
+            if section_id and tables:
                 db.assign_tables_to_section(section_id, tables)
+        if section_id:
             refresh_sections()
             return True
         return False
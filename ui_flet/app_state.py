@@ -6,6 +6,7 @@ Centralized state for filters, reservations, navigation, language, and theme.
 
 from datetime import date, datetime
 from typing import Optional, Callable, List, Dict, Any
+from core import combine_datetime_components
 from ui_flet.i18n import get_current_language, set_language as i18n_set_language
 from ui_flet.theme_manager import get_current_theme, set_theme as theme_set_theme
 
@@ -36,9 +37,15 @@ class AppState:
         self.selected_day = str(self._selected_date.day)
         
         # Data cache
-        self.reservations: List[Dict[str, Any]] = []
+        self.reservations: List[Any] = []  # List of core.Reservation records
         self.table_states: Dict[int, tuple] = {}
         
+        # Built settings screens keyed by (language, theme), reused on re-entry
+        self.settings_screen_cache: Dict[tuple, Any] = {}
+        
+        # Settings dropdown option lists; theme labels are keyed by language
+        self.settings_options_cache: Dict[Any, list] = {}
+        
         # Navigation
         self.current_screen = "reservations"  # reservations, table_layout, admin, user_settings
         
@@ -56,6 +63,10 @@ class AppState:
         
         # Callbacks for UI refresh
         self.on_state_change: Optional[Callable] = None
+        
+        # Cleanup registered by the current screen (e.g. cancelling pending
+        # timers), run by the app before that screen is replaced
+        self.on_screen_teardown: Optional[Callable] = None
     
     def _get_month_bulgarian(self, month_num: int) -> str:
         """Get month name in Bulgarian by number (1-12)."""
@@ -135,8 +146,6 @@ class AppState:
         
         Returns None if hour is "Всички".
         """
-        from core import combine_datetime_components
-        
         if self.selected_hour == "Всички":
             return None
         
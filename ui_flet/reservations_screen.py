@@ -52,11 +52,8 @@ def create_reservations_screen(
         """Get waiter name by ID."""
         if waiter_id is None:
             return ""
-        waiters = db.get_waiters()
-        for w in waiters:
-            if w["id"] == waiter_id:
-                return w["name"]
-        return ""
+        waiter = db.get_waiter(waiter_id)
+        return waiter["name"] if waiter else ""
     
     def refresh_reservations():
         """Refresh the reservations table."""
@@ -84,8 +81,8 @@ def create_reservations_screen(
         rows = []
         for res in reservations:
             # Status display
-            status_display = "Резервирана" if res["status"] == "Reserved" else "Отменена"
-            status_color = Colors.GREEN if res["status"] == "Reserved" else Colors.RED
+            status_display = "Резервирана" if res.status == "Reserved" else "Отменена"
+            status_color = Colors.GREEN if res.status == "Reserved" else Colors.RED
             
             # Action buttons
             def make_edit_handler(res_id):
@@ -97,23 +94,23 @@ def create_reservations_screen(
             rows.append(
                 ft.DataRow(
                     cells=[
-                        ft.DataCell(ft.Text(str(res["table_number"]))),
-                        ft.DataCell(ft.Text(res["time_slot"])),
-                        ft.DataCell(ft.Text(res["customer_name"])),
-                        ft.DataCell(ft.Text(res["phone_number"] or "")),
-                        ft.DataCell(ft.Text(get_waiter_name(res["waiter_id"]))),
+                        ft.DataCell(ft.Text(str(res.table_number))),
+                        ft.DataCell(ft.Text(res.time_slot)),
+                        ft.DataCell(ft.Text(res.customer_name)),
+                        ft.DataCell(ft.Text(res.phone_number or "")),
+                        ft.DataCell(ft.Text(get_waiter_name(res.waiter_id))),
                         ft.DataCell(ft.Text(status_display, color=status_color)),
                         ft.DataCell(
                             ft.Row([
                                 ft.IconButton(
                                     icon=icons.EDIT,
                                     tooltip="Промени",
-                                    on_click=make_edit_handler(res["id"])
+                                    on_click=make_edit_handler(res.id)
                                 ),
                                 ft.IconButton(
                                     icon=icons.DELETE,
                                     tooltip="Изтрий",
-                                    on_click=make_delete_handler(res["id"])
+                                    on_click=make_delete_handler(res.id)
                                 ),
                             ], spacing=5)
                         ),
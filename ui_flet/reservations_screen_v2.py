@@ -36,11 +36,8 @@ def create_reservations_screen(
         """Get waiter name by ID."""
         if waiter_id is None:
             return ""
-        waiters = db.get_waiters()
-        for w in waiters:
-            if w["id"] == waiter_id:
-                return w["name"]
-        return ""
+        waiter = db.get_waiter(waiter_id)
+        return waiter["name"] if waiter else ""
     
     def refresh_reservations():
         """Refresh the reservations list based on current filters."""
@@ -86,8 +83,8 @@ def create_reservations_screen(
         else:
             for res in reservations:
                 # Status display
-                status_display = "Резервирана" if res["status"] == "Reserved" else "Отменена"
-                status_color = Colors.SUCCESS if res["status"] == "Reserved" else Colors.DANGER
+                status_display = "Резервирана" if res.status == "Reserved" else "Отменена"
+                status_color = Colors.SUCCESS if res.status == "Reserved" else Colors.DANGER
                 
                 # Build reservation card
                 card = glass_container(
@@ -95,7 +92,7 @@ def create_reservations_screen(
                         [
                             # Table number
                             ft.Container(
-                                content=body_text(f"#{res['table_number']}", weight=FontWeight.BOLD),
+                                content=body_text(f"#{res.table_number}", weight=FontWeight.BOLD),
                                 width=60,
                             ),
                             # Time
@@ -103,7 +100,7 @@ def create_reservations_screen(
                                 content=ft.Column(
                                     [
                                         label("Час"),
-                                        body_text(res["time_slot"]),
+                                        body_text(res.time_slot),
                                     ],
                                     spacing=2,
                                 ),
@@ -114,7 +111,7 @@ def create_reservations_screen(
                                 content=ft.Column(
                                     [
                                         label("Клиент"),
-                                        body_text(res["customer_name"]),
+                                        body_text(res.customer_name),
                                     ],
                                     spacing=2,
                                 ),
@@ -125,7 +122,7 @@ def create_reservations_screen(
                                 content=ft.Column(
                                     [
                                         label("Телефон"),
-                                        body_text(res["phone_number"] or "-"),
+                                        body_text(res.phone_number or "-"),
                                     ],
                                     spacing=2,
                                 ),
@@ -136,7 +133,7 @@ def create_reservations_screen(
                                 content=ft.Column(
                                     [
                                         label("Сервитьор"),
-                                        body_text(get_waiter_name(res["waiter_id"])),
+                                        body_text(get_waiter_name(res.waiter_id)),
                                     ],
                                     spacing=2,
                                 ),
@@ -160,13 +157,13 @@ def create_reservations_screen(
                                         icon=icons.EDIT,
                                         tooltip="Промени",
                                         icon_color=Colors.ACCENT_PRIMARY,
-                                        on_click=lambda e, r=res: open_edit_dialog(r)
+                                        on_click=lambda e, r=res._asdict(): open_edit_dialog(r)
                                     ),
                                     ft.IconButton(
                                         icon=icons.DELETE,
                                         tooltip="Изтрий",
                                         icon_color=Colors.DANGER,
-                                        on_click=lambda e, r=res: delete_reservation(r["id"])
+                                        on_click=lambda e, r=res: delete_reservation(r.id)
                                     ),
                                 ],
                                 spacing=0,
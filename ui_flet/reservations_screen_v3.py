@@ -10,6 +10,7 @@ Features:
 
 import flet as ft
 from datetime import datetime, date
+from functools import lru_cache
 from typing import Callable
 from core import ReservationService, TableLayoutService
 from db import DBManager
@@ -20,47 +21,128 @@ from ui_flet.action_panel import ActionPanel
 from ui_flet.i18n import t, get_month_name
 
 
-def create_reservations_screen(
-    page: ft.Page,
-    reservation_service: ReservationService,
-    table_layout_service: TableLayoutService,
-    db: DBManager,
-    app_state,
-    refresh_callback: Callable
-):
-    """Create the reservations screen with left sidebar and Action Panel integration."""
-    
-    # Reservations list container (expand=True for proper touch scrolling on mobile)
-    reservations_list = ft.Column(spacing=Spacing.SM, scroll=ScrollMode.AUTO, expand=True)
-    
-    # Right content area (will compress when panel opens)
-    right_content = ft.Container(expand=True)
-    
-    def get_waiter_name(waiter_id):
+# Status -> (theme color attribute, translation key).
+# Resolved once per refresh so theme/language switches are picked up.
+_STATUS_STYLE = {
+    "Reserved": ("SUCCESS", "reserved"),
+    "Cancelled": ("DANGER", "cancelled"),
+}
+
+
+@lru_cache(maxsize=128)
+def _format_filter_date(d: date, lang: str) -> str:
+    """Format a filter date as "<day> <month name> <year>" for the given language."""
+    return f"{d.day} {get_month_name(d.month, lang)} {d.year}"
+
+
+class ReservationsScreen:
+    """
+    Reservations screen with left sidebar and Action Panel integration.
+
+    Handlers are bound methods and screen state lives on the instance,
+    so building the screen doesn't allocate a closure per callback.
+    """
+
+    def __init__(
+        self,
+        page: ft.Page,
+        reservation_service: ReservationService,
+        table_layout_service: TableLayoutService,
+        db: DBManager,
+        app_state,
+        refresh_callback: Callable
+    ):
+        """
+        Initialize the reservations screen.
+
+        Args:
+            page: Flet page instance
+            reservation_service: Reservation business logic
+            table_layout_service: Table layout business logic
+            db: Database manager
+            app_state: Shared application state
+            refresh_callback: Callback to rebuild the current screen
+        """
+        self.page = page
+        self.reservation_service = reservation_service
+        self.table_layout_service = table_layout_service
+        self.db = db
+        self.app_state = app_state
+        self.refresh_callback = refresh_callback
+
+        # Last (date, language) shown in the date field - skips redundant updates
+        self._last_date_key = None
+
+        # Waiter id -> name, reloaded once per refresh
+        self._waiter_names = {}
+
+        # Determine if we're on a narrow screen (tablet/mobile)
+        # Default to wide screen if window_width is not available (desktop usually starts wide)
+        try:
+            self.is_narrow_screen = page.window_width and page.window_width < 900
+        except:
+            self.is_narrow_screen = False
+
+        # Reservations list container (expand=True for proper touch scrolling on mobile).
+        # ListView only builds the cards that are scrolled into view, so large
+        # days (hundreds of reservations) don't pay layout cost for off-screen rows.
+        self.reservations_list = ft.ListView(spacing=Spacing.SM, expand=True)
+
+        # Right content area (will compress when panel opens)
+        self.right_content = ft.Container(expand=True)
+
+        # Create action panel
+        self.action_panel = ActionPanel(
+            page=page,
+            on_close=self._handle_panel_close,
+            on_save=self._handle_save,
+            on_delete=self._handle_delete,
+            get_waiters=db.get_waiters,
+        )
+
+        # Date display text (updated when filter changes)
+        self.date_display_text = body_text(self._get_date_display(), weight=FontWeight.MEDIUM)
+
+    # ==========================================
+    # Helpers
+    # ==========================================
+
+    def _get_waiter_name(self, waiter_id) -> str:
         """Get waiter name by ID."""
         if waiter_id is None:
             return ""
-        waiters = db.get_waiters()
-        for w in waiters:
-            if w["id"] == waiter_id:
-                return w["name"]
-        return ""
-    
-    def get_date_display():
+        return self._waiter_names.get(waiter_id, "")
+
+    def _get_date_display(self) -> str:
         """Get the current filter date for display (localized)."""
-        d = app_state.filter_date
-        month_name = get_month_name(d.month)
-        return f"{d.day} {month_name} {d.year}"
-    
-    def refresh_reservations():
+        return _format_filter_date(self.app_state.filter_date, self.app_state.language)
+
+    def _show_snack(self, message: str, bgcolor: str):
+        """Show a snack bar message."""
+        self.page.snack_bar = ft.SnackBar(
+            ft.Text(message, color=Colors.TEXT_PRIMARY),
+            bgcolor=bgcolor
+        )
+        self.page.snack_bar.open = True
+
+    # ==========================================
+    # Reservations List
+    # ==========================================
+
+    def refresh_reservations(self):
         """Refresh the reservations list based on current filters."""
+        app_state = self.app_state
+
         # Get filter parameters
         selected_date = app_state.get_selected_date()
         selected_dt = app_state.get_selected_datetime()
-        
-        # Update date display
-        date_display_text.value = get_date_display()
-        
+
+        # Update date display (only when the date or language changed)
+        date_key = (app_state.filter_date, app_state.language)
+        if date_key != self._last_date_key:
+            self.date_display_text.value = self._get_date_display()
+            self._last_date_key = date_key
+
         # Convert status filter
         status_filter = None
         if app_state.selected_status != "Всички" and app_state.selected_status != t("all"):
@@ -68,7 +150,7 @@ def create_reservations_screen(
                 status_filter = "Reserved"
             else:
                 status_filter = "Cancelled"
-        
+
         # Convert table filter
         table_filter = None
         if app_state.selected_table != "Всички" and app_state.selected_table != t("all"):
@@ -76,23 +158,24 @@ def create_reservations_screen(
                 table_filter = int(app_state.selected_table)
             except:
                 pass
-        
+
         # Get filtered reservations with date constraint
-        reservations = reservation_service.list_reservations_for_context(
+        reservations = self.reservation_service.list_reservations_for_context(
             selected_date=selected_date,
             selected_time=selected_dt,
             status_filter=status_filter,
             table_filter=table_filter
         )
-        
+
         # Store in app state
         app_state.reservations = reservations
-        
+
         # Build list items
-        reservations_list.controls.clear()
-        
+        controls = self.reservations_list.controls
+        controls.clear()
+
         if not reservations:
-            reservations_list.controls.append(
+            controls.append(
                 ft.Container(
                     content=body_text(t("no_reservations"), color=Colors.TEXT_SECONDARY),
                     padding=Spacing.XL,
@@ -100,144 +183,162 @@ def create_reservations_screen(
                 )
             )
         else:
+            # Resolve status colors/labels and waiter names once for the whole list
+            status_styles = {
+                status: (getattr(Colors, color_attr), t(text_key))
+                for status, (color_attr, text_key) in _STATUS_STYLE.items()
+            }
+            self._waiter_names = {w["id"]: w["name"] for w in self.db.get_waiters()}
+
             for res in reservations:
-                # Status display
-                status_display = t("reserved") if res["status"] == "Reserved" else t("cancelled")
-                status_color = Colors.SUCCESS if res["status"] == "Reserved" else Colors.DANGER
-                
-                # Build reservation card (with correct closure for res_id)
-                res_id = res["id"]
-                res_copy = dict(res)  # Copy for closure
-                
-                # Get notes/additional_info for display
-                notes_text = res.get("additional_info") or ""
-                
-                # Build the main row content
-                # Uses compact fixed widths + expand on flexible columns so
-                # edit/delete buttons are always visible even on scaled tablets.
-                main_row_content = [
-                    # Table number (compact)
-                    ft.Container(
-                        content=body_text(f"#{res['table_number']}", weight=FontWeight.BOLD),
-                        width=44,
-                    ),
-                    # Time (fixed - datetime is always same length)
-                    ft.Container(
-                        content=ft.Column(
-                            [
-                                label(t("time"), color=Colors.TEXT_SECONDARY),
-                                body_text(res["time_slot"], weight=FontWeight.MEDIUM),
-                            ],
-                            spacing=2,
-                        ),
-                        width=130,
-                    ),
-                    # Customer (expand - takes up remaining space)
-                    ft.Container(
-                        content=ft.Column(
-                            [
-                                label(t("customer"), color=Colors.TEXT_SECONDARY),
-                                body_text(res["customer_name"], weight=FontWeight.MEDIUM),
-                            ],
-                            spacing=2,
-                        ),
-                        expand=2,
-                    ),
-                    # Phone (compact)
-                    ft.Container(
-                        content=ft.Column(
-                            [
-                                label(t("phone"), color=Colors.TEXT_SECONDARY),
-                                body_text(res["phone_number"] or "-"),
-                            ],
-                            spacing=2,
-                        ),
-                        expand=2,
-                        visible=not is_narrow_screen,
-                    ),
-                    # Waiter (hidden on narrow screens to save space)
-                    ft.Container(
-                        content=ft.Column(
-                            [
-                                label(t("waiter"), color=Colors.TEXT_SECONDARY),
-                                body_text(get_waiter_name(res.get("waiter_id"))),
-                            ],
-                            spacing=2,
-                        ),
-                        expand=2,
-                        visible=not is_narrow_screen,
-                    ),
-                    # Notes (hidden on narrow screens)
-                    ft.Container(
-                        content=ft.Column(
-                            [
-                                label(t("notes"), color=Colors.TEXT_SECONDARY),
-                                body_text(
-                                    notes_text if notes_text else "-",
-                                    size=Typography.SIZE_SM,
-                                    color=Colors.TEXT_PRIMARY if notes_text else Colors.TEXT_DISABLED,
-                                ),
-                            ],
-                            spacing=2,
+                controls.append(self._build_card(res, status_styles))
+
+        self.page.update()
+
+    def _build_card(self, res, status_styles: dict) -> ft.Container:
+        """Build a single reservation card."""
+        is_narrow_screen = self.is_narrow_screen
+        action_panel = self.action_panel
+
+        # Status display
+        status_color, status_display = status_styles.get(res.status, status_styles["Cancelled"])
+
+        # Build reservation card (mutable dict copy for the action panel)
+        res_copy = res._asdict()
+
+        # Get notes/additional_info for display (single branch)
+        notes_text = res.additional_info
+        notes_display, notes_color = (
+            (notes_text, Colors.TEXT_PRIMARY) if notes_text
+            else ("-", Colors.TEXT_DISABLED)
+        )
+
+        # Build the main row content
+        # Uses compact fixed widths + expand on flexible columns so
+        # edit/delete buttons are always visible even on scaled tablets.
+        main_row_content = [
+            # Table number (compact)
+            ft.Container(
+                content=body_text(f"#{res.table_number}", weight=FontWeight.BOLD),
+                width=44,
+            ),
+            # Time (fixed - datetime is always same length)
+            ft.Container(
+                content=ft.Column(
+                    [
+                        label(t("time"), color=Colors.TEXT_SECONDARY),
+                        body_text(res.time_slot, weight=FontWeight.MEDIUM),
+                    ],
+                    spacing=2,
+                ),
+                width=130,
+            ),
+            # Customer (expand - takes up remaining space)
+            ft.Container(
+                content=ft.Column(
+                    [
+                        label(t("customer"), color=Colors.TEXT_SECONDARY),
+                        body_text(res.customer_name, weight=FontWeight.MEDIUM),
+                    ],
+                    spacing=2,
+                ),
+                expand=2,
+            ),
+            # Phone (compact)
+            ft.Container(
+                content=ft.Column(
+                    [
+                        label(t("phone"), color=Colors.TEXT_SECONDARY),
+                        body_text(res.phone_number or "-"),
+                    ],
+                    spacing=2,
+                ),
+                expand=2,
+                visible=not is_narrow_screen,
+            ),
+            # Waiter (hidden on narrow screens to save space)
+            ft.Container(
+                content=ft.Column(
+                    [
+                        label(t("waiter"), color=Colors.TEXT_SECONDARY),
+                        body_text(self._get_waiter_name(res.waiter_id)),
+                    ],
+                    spacing=2,
+                ),
+                expand=2,
+                visible=not is_narrow_screen,
+            ),
+            # Notes (hidden on narrow screens)
+            ft.Container(
+                content=ft.Column(
+                    [
+                        label(t("notes"), color=Colors.TEXT_SECONDARY),
+                        body_text(
+                            notes_display,
+                            size=Typography.SIZE_SM,
+                            color=notes_color,
                         ),
-                        expand=2,
-                        visible=not is_narrow_screen,
-                    ),
-                    # Status badge (compact)
-                    ft.Container(
-                        content=ft.Container(
-                            content=body_text(status_display, size=Typography.SIZE_SM),
-                            bgcolor=status_color + "40",
-                            border_radius=Radius.SM,
-                            padding=ft.padding.symmetric(horizontal=6, vertical=4),
+                    ],
+                    spacing=2,
+                ),
+                expand=2,
+                visible=not is_narrow_screen,
+            ),
+            # Status badge (compact)
+            ft.Container(
+                content=ft.Container(
+                    content=body_text(status_display, size=Typography.SIZE_SM),
+                    bgcolor=status_color + "40",
+                    border_radius=Radius.SM,
+                    padding=ft.padding.symmetric(horizontal=6, vertical=4),
+                ),
+                width=90,
+            ),
+            # Actions - always visible, fixed width
+            ft.Container(
+                content=ft.Row(
+                    [
+                        ft.IconButton(
+                            icon=icons.EDIT,
+                            icon_color=Colors.ACCENT_PRIMARY,
+                            icon_size=20,
+                            tooltip=t("edit"),
+                            on_click=lambda e, r=res_copy: action_panel.open_edit(r),
                         ),
-                        width=90,
-                    ),
-                    # Actions - always visible, fixed width
-                    ft.Container(
-                        content=ft.Row(
-                            [
-                                ft.IconButton(
-                                    icon=icons.EDIT,
-                                    icon_color=Colors.ACCENT_PRIMARY,
-                                    icon_size=20,
-                                    tooltip=t("edit"),
-                                    on_click=lambda e, r=res_copy: action_panel.open_edit(r),
-                                ),
-                                ft.IconButton(
-                                    icon=icons.DELETE,
-                                    icon_color=Colors.DANGER,
-                                    icon_size=20,
-                                    tooltip=t("delete"),
-                                    on_click=lambda e, r=res_copy: action_panel.open_delete(r),
-                                ),
-                            ],
-                            spacing=0,
-                            tight=True,
+                        ft.IconButton(
+                            icon=icons.DELETE,
+                            icon_color=Colors.DANGER,
+                            icon_size=20,
+                            tooltip=t("delete"),
+                            on_click=lambda e, r=res_copy: action_panel.open_delete(r),
                         ),
-                        width=80,
-                    ),
-                ]
-                
-                card = glass_container(
-                    content=ft.Row(
-                        main_row_content,
-                        alignment=ft.MainAxisAlignment.START,
-                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                    ),
-                    padding=Spacing.MD,
-                )
-                
-                reservations_list.controls.append(card)
-        
-        page.update()
-    
-    def handle_save(data: dict):
+                    ],
+                    spacing=0,
+                    tight=True,
+                ),
+                width=80,
+            ),
+        ]
+
+        return glass_container(
+            content=ft.Row(
+                main_row_content,
+                alignment=ft.MainAxisAlignment.START,
+                vertical_alignment=ft.CrossAxisAlignment.CENTER,
+            ),
+            padding=Spacing.MD,
+        )
+
+    # ==========================================
+    # Action Panel Handlers
+    # ==========================================
+
+    def _handle_save(self, data: dict):
         """Handle save from action panel (create or edit)."""
         try:
             if "id" in data:
                 # Edit existing - preserve status as "Reserved"
-                success = reservation_service.update_reservation(
+                success = self.reservation_service.update_reservation(
                     reservation_id=data["id"],
                     table_number=data["table_number"],
                     time_slot=data["time_slot"],
@@ -250,7 +351,7 @@ def create_reservations_screen(
                 message = t("reservation_updated")
             else:
                 # Create new
-                success = reservation_service.create_reservation(
+                success = self.reservation_service.create_reservation(
                     table_number=data["table_number"],
                     time_slot=data["time_slot"],
                     customer_name=data["customer_name"],
@@ -259,406 +360,416 @@ def create_reservations_screen(
                     waiter_id=data["waiter_id"]
                 )
                 message = t("reservation_created")
-            
+
             if success:
-                refresh_reservations()
-                refresh_callback()  # Refresh table layout too
-                page.snack_bar = ft.SnackBar(
-                    ft.Text(message, color=Colors.TEXT_PRIMARY),
-                    bgcolor=Colors.SUCCESS
-                )
-                page.snack_bar.open = True
+                self.refresh_reservations()
+                self.refresh_callback()  # Refresh table layout too
+                self._show_snack(message, Colors.SUCCESS)
             else:
-                page.snack_bar = ft.SnackBar(
-                    ft.Text(t("error_overlap"), color=Colors.TEXT_PRIMARY),
-                    bgcolor=Colors.DANGER
-                )
-                page.snack_bar.open = True
-            page.update()
+                self._show_snack(t("error_overlap"), Colors.DANGER)
+            self.page.update()
         except Exception as ex:
-            page.snack_bar = ft.SnackBar(
-                ft.Text(f"{t('error')}: {str(ex)}", color=Colors.TEXT_PRIMARY),
-                bgcolor=Colors.DANGER
-            )
-            page.snack_bar.open = True
-            page.update()
-    
-    def handle_delete(res_id: int):
+            self._show_snack(f"{t('error')}: {str(ex)}", Colors.DANGER)
+            self.page.update()
+
+    def _handle_delete(self, res_id: int):
         """Handle delete from action panel."""
-        reservation_service.cancel_reservation(res_id)
-        refresh_reservations()
-        refresh_callback()
-        page.snack_bar = ft.SnackBar(
-            ft.Text(t("reservation_cancelled"), color=Colors.TEXT_PRIMARY),
-            bgcolor=Colors.SUCCESS
-        )
-        page.snack_bar.open = True
-        page.update()
-    
-    def handle_panel_close():
+        self.reservation_service.cancel_reservation(res_id)
+        self.refresh_reservations()
+        self.refresh_callback()
+        self._show_snack(t("reservation_cancelled"), Colors.SUCCESS)
+        self.page.update()
+
+    def _handle_panel_close(self):
         """Handle action panel close."""
-        page.update()
-    
-    # Create action panel
-    action_panel = ActionPanel(
-        page=page,
-        on_close=handle_panel_close,
-        on_save=handle_save,
-        on_delete=handle_delete,
-        get_waiters=lambda: db.get_waiters(),
-    )
-    
+        self.page.update()
+
     # ==========================================
-    # Date Picker Setup
+    # Filter Handlers
     # ==========================================
-    
-    def open_date_picker(e):
+
+    def _open_date_picker(self, e):
         """Open the date picker dialog."""
-        current_date = app_state.filter_date
-        
-        def handle_date_change(e):
-            if e.control.value:
-                selected_date = e.control.value
-                app_state.update_filter(filter_date=selected_date)
-                refresh_reservations()
-        
-        def handle_dismiss(e):
-            pass  # Do nothing on dismiss
-        
         date_picker = ft.DatePicker(
             first_date=date(2020, 1, 1),
             last_date=date(2030, 12, 31),
-            value=current_date,
-            on_change=handle_date_change,
-            on_dismiss=handle_dismiss,
+            value=self.app_state.filter_date,
+            on_change=self._handle_date_change,
+            on_dismiss=self._handle_date_dismiss,
         )
-        
-        page.overlay.append(date_picker)
+
+        self.page.overlay.append(date_picker)
         date_picker.open = True
-        page.update()
-    
-    # Date display text (updated when filter changes)
-    date_display_text = body_text(get_date_display(), weight=FontWeight.MEDIUM)
-    
-    # Date picker button
-    date_picker_field = ft.Container(
-        content=ft.Row(
+        self.page.update()
+
+    def _handle_date_change(self, e):
+        """Apply the date picked in the date picker."""
+        if e.control.value:
+            self.app_state.update_filter(filter_date=e.control.value)
+            self.refresh_reservations()
+
+    def _handle_date_dismiss(self, e):
+        """Do nothing on date picker dismiss."""
+        pass
+
+    def _on_hour_change(self, e):
+        self.app_state.update_filter(selected_hour=e.control.value)
+        self.refresh_reservations()
+
+    def _on_minute_change(self, e):
+        self.app_state.update_filter(selected_minute=e.control.value)
+        self.refresh_reservations()
+
+    def _on_status_change(self, e):
+        self.app_state.update_filter(selected_status=e.control.value)
+        self.refresh_reservations()
+
+    def _on_table_change(self, e):
+        self.app_state.update_filter(selected_table=e.control.value)
+        self.refresh_reservations()
+
+    def _open_create(self, e):
+        self.action_panel.open_create(self.app_state)
+
+    def _toggle_drawer(self, e):
+        """Toggle the navigation drawer on narrow screens."""
+        self.drawer.open = not self.drawer.open
+        self.drawer.update()
+
+    def _navigate_to_layout(self, e):
+        self.app_state.navigate_to("table_layout")
+
+    # ==========================================
+    # Layout
+    # ==========================================
+
+    def build(self) -> ft.Stack:
+        """Build the screen controls and load the initial data."""
+        page = self.page
+        app_state = self.app_state
+        is_narrow_screen = self.is_narrow_screen
+
+        # Date picker button
+        date_picker_field = ft.Container(
+            content=ft.Row(
+                [
+                    ft.Container(
+                        content=self.date_display_text,
+                        expand=True,
+                    ),
+                    ft.Icon(icons.CALENDAR_TODAY, color=Colors.ACCENT_PRIMARY, size=20),
+                ],
+                alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+            ),
+            bgcolor=Colors.SURFACE_GLASS,
+            border=ft.border.all(1, Colors.BORDER),
+            border_radius=Radius.SM,
+            padding=ft.padding.symmetric(horizontal=Spacing.MD, vertical=Spacing.SM),
+            on_click=self._open_date_picker,
+            ink=True,
+        )
+
+        # ==========================================
+        # Filter Dropdowns
+        # ==========================================
+
+        hour_dropdown = ft.Dropdown(
+            label=t("hour"),
+            value=app_state.selected_hour,
+            options=[ft.dropdown.Option(t("all"))] + [ft.dropdown.Option(f"{h:02d}") for h in range(24)],
+            on_change=self._on_hour_change,
+            width=None,
+            text_size=Typography.SIZE_XS,  # Smaller to prevent wrapping
+            dense=True,
+            bgcolor=Colors.SURFACE_GLASS,
+            border_color=Colors.BORDER,
+            color=Colors.INPUT_TEXT,
+        )
+
+        minute_dropdown = ft.Dropdown(
+            label=t("minutes"),
+            value=app_state.selected_minute,
+            options=[ft.dropdown.Option(m) for m in ["00", "15", "30", "45"]],
+            on_change=self._on_minute_change,
+            width=None,
+            text_size=Typography.SIZE_XS,  # Smaller to prevent wrapping
+            dense=True,
+            bgcolor=Colors.SURFACE_GLASS,
+            border_color=Colors.BORDER,
+            color=Colors.INPUT_TEXT,
+        )
+
+        status_dropdown = ft.Dropdown(
+            label=t("status"),
+            value=app_state.selected_status,
+            options=[
+                ft.dropdown.Option(t("all")),
+                ft.dropdown.Option(t("reserved")),
+                ft.dropdown.Option(t("cancelled")),
+            ],
+            on_change=self._on_status_change,
+            width=None,
+            text_size=Typography.SIZE_XS,  # Smaller to prevent wrapping
+            dense=True,
+            bgcolor=Colors.SURFACE_GLASS,
+            border_color=Colors.BORDER,
+            color=Colors.INPUT_TEXT,
+        )
+
+        table_dropdown = ft.Dropdown(
+            label=t("table"),
+            value=app_state.selected_table,
+            options=[ft.dropdown.Option(t("all"))] + [ft.dropdown.Option(str(i)) for i in range(1, 51)],
+            on_change=self._on_table_change,
+            width=None,
+            text_size=Typography.SIZE_XS,  # Smaller to prevent wrapping
+            dense=True,
+            bgcolor=Colors.SURFACE_GLASS,
+            border_color=Colors.BORDER,
+            color=Colors.INPUT_TEXT,  # Use theme input text color
+        )
+
+        # ==========================================
+        # Left Sidebar (Responsive)
+        # ==========================================
+
+        # Sidebar content (shared between normal sidebar and drawer)
+        sidebar_content = ft.Column(
             [
+                # Title
+                heading(t("filters"), size=Typography.SIZE_LG, weight=FontWeight.BOLD),
+                ft.Divider(height=1, color=Colors.BORDER),
+
+                # Date picker
                 ft.Container(
-                    content=date_display_text,
-                    expand=True,
+                    content=ft.Column([
+                        label(t("date"), color=Colors.TEXT_SECONDARY),
+                        date_picker_field,
+                    ], spacing=4),
+                    padding=ft.padding.only(top=Spacing.SM),
                 ),
-                ft.Icon(icons.CALENDAR_TODAY, color=Colors.ACCENT_PRIMARY, size=20),
+
+                ft.Container(height=Spacing.SM),
+
+                # Time filters (hour + minute)
+                ft.Row([
+                    ft.Container(content=hour_dropdown, expand=True),
+                    ft.Container(content=minute_dropdown, expand=True),
+                ], spacing=Spacing.XS),
+
+                ft.Container(height=Spacing.SM),
+
+                # Status and Table filters - stacked vertically
+                status_dropdown,
+
+                ft.Container(height=Spacing.XS),
+
+                table_dropdown,
+
+                ft.Container(expand=True),  # Spacer
+
+                ft.Divider(height=1, color=Colors.BORDER),
+
+                # Create reservation button
+                glass_button(
+                    t("create_reservation"),
+                    icon=icons.ADD,
+                    on_click=self._open_create,
+                    variant="primary",
+                    width=None,
+                ),
+
             ],
-            alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
-        ),
-        bgcolor=Colors.SURFACE_GLASS,
-        border=ft.border.all(1, Colors.BORDER),
-        border_radius=Radius.SM,
-        padding=ft.padding.symmetric(horizontal=Spacing.MD, vertical=Spacing.SM),
-        on_click=open_date_picker,
-        ink=True,
-    )
-    
-    # ==========================================
-    # Filter Dropdowns
-    # ==========================================
-    
-    hour_dropdown = ft.Dropdown(
-        label=t("hour"),
-        value=app_state.selected_hour,
-        options=[ft.dropdown.Option(t("all"))] + [ft.dropdown.Option(f"{h:02d}") for h in range(24)],
-        on_change=lambda e: app_state.update_filter(selected_hour=e.control.value) or refresh_reservations(),
-        width=None,
-        text_size=Typography.SIZE_XS,  # Smaller to prevent wrapping
-        dense=True,
-        bgcolor=Colors.SURFACE_GLASS,
-        border_color=Colors.BORDER,
-        color=Colors.INPUT_TEXT,
-    )
-    
-    minute_dropdown = ft.Dropdown(
-        label=t("minutes"),
-        value=app_state.selected_minute,
-        options=[ft.dropdown.Option(m) for m in ["00", "15", "30", "45"]],
-        on_change=lambda e: app_state.update_filter(selected_minute=e.control.value) or refresh_reservations(),
-        width=None,
-        text_size=Typography.SIZE_XS,  # Smaller to prevent wrapping
-        dense=True,
-        bgcolor=Colors.SURFACE_GLASS,
-        border_color=Colors.BORDER,
-        color=Colors.INPUT_TEXT,
-    )
-    
-    status_dropdown = ft.Dropdown(
-        label=t("status"),
-        value=app_state.selected_status,
-        options=[
-            ft.dropdown.Option(t("all")),
-            ft.dropdown.Option(t("reserved")),
-            ft.dropdown.Option(t("cancelled")),
-        ],
-        on_change=lambda e: app_state.update_filter(selected_status=e.control.value) or refresh_reservations(),
-        width=None,
-        text_size=Typography.SIZE_XS,  # Smaller to prevent wrapping
-        dense=True,
-        bgcolor=Colors.SURFACE_GLASS,
-        border_color=Colors.BORDER,
-        color=Colors.INPUT_TEXT,
-    )
-    
-    table_dropdown = ft.Dropdown(
-        label=t("table"),
-        value=app_state.selected_table,
-        options=[ft.dropdown.Option(t("all"))] + [ft.dropdown.Option(str(i)) for i in range(1, 51)],
-        on_change=lambda e: app_state.update_filter(selected_table=e.control.value) or refresh_reservations(),
-        width=None,
-        text_size=Typography.SIZE_XS,  # Smaller to prevent wrapping
-        dense=True,
-        bgcolor=Colors.SURFACE_GLASS,
-        border_color=Colors.BORDER,
-        color=Colors.INPUT_TEXT,  # Use theme input text color
-    )
-    
-    # ==========================================
-    # Left Sidebar (Responsive)
-    # ==========================================
-    
-    # Sidebar content (shared between normal sidebar and drawer)
-    sidebar_content = ft.Column(
-        [
-            # Title
-            heading(t("filters"), size=Typography.SIZE_LG, weight=FontWeight.BOLD),
-            ft.Divider(height=1, color=Colors.BORDER),
-            
-            # Date picker
-            ft.Container(
-                content=ft.Column([
-                    label(t("date"), color=Colors.TEXT_SECONDARY),
-                    date_picker_field,
-                ], spacing=4),
-                padding=ft.padding.only(top=Spacing.SM),
+            spacing=Spacing.SM,
+            expand=True,
+        )
+
+        # Create drawer for narrow screens (filters only, not action buttons)
+        drawer_content_filters = ft.Column(
+            [
+                # Title
+                heading(t("filters"), size=Typography.SIZE_LG, weight=FontWeight.BOLD),
+                ft.Divider(height=1, color=Colors.BORDER),
+
+                # Date picker
+                ft.Container(
+                    content=ft.Column([
+                        label(t("date"), color=Colors.TEXT_SECONDARY),
+                        date_picker_field,
+                    ], spacing=4),
+                    padding=ft.padding.only(top=Spacing.SM),
+                ),
+
+                ft.Container(height=Spacing.SM),
+
+                # Time filters (hour + minute)
+                ft.Row([
+                    ft.Container(content=hour_dropdown, expand=True),
+                    ft.Container(content=minute_dropdown, expand=True),
+                ], spacing=Spacing.XS),
+
+                ft.Container(height=Spacing.SM),
+
+                # Status and Table filters - stacked vertically
+                status_dropdown,
+
+                ft.Container(height=Spacing.XS),
+
+                table_dropdown,
+            ],
+            spacing=Spacing.SM,
+            scroll=ScrollMode.AUTO,
+        )
+
+        self.drawer = ft.NavigationDrawer(
+            controls=[
+                ft.Container(
+                    content=glass_container(
+                        content=drawer_content_filters,
+                        padding=Spacing.LG,
+                    ),
+                    padding=Spacing.MD,
+                    height=page.window_height - 100 if hasattr(page, 'window_height') and page.window_height else 800,
+                )
+            ],
+            bgcolor=Colors.SURFACE + "E6",  # Semi-transparent
+        )
+
+        # Left sidebar (visible on wide screens only)
+        left_sidebar = ft.Container(
+            content=glass_container(
+                content=sidebar_content,
+                padding=Spacing.LG,
             ),
-            
-            ft.Container(height=Spacing.SM),
-            
-            # Time filters (hour + minute)
-            ft.Row([
-                ft.Container(content=hour_dropdown, expand=True),
-                ft.Container(content=minute_dropdown, expand=True),
-            ], spacing=Spacing.XS),
-            
-            ft.Container(height=Spacing.SM),
-            
-            # Status and Table filters - stacked vertically
-            status_dropdown,
-            
-            ft.Container(height=Spacing.XS),
-            
-            table_dropdown,
-            
-            ft.Container(expand=True),  # Spacer
-            
-            ft.Divider(height=1, color=Colors.BORDER),
-            
-            # Create reservation button
-            glass_button(
-                t("create_reservation"),
-                icon=icons.ADD,
-                on_click=lambda e: action_panel.open_create(app_state),
-                variant="primary",
-                width=None,
+            width=240,
+            padding=Spacing.MD,
+            visible=not is_narrow_screen,
+        )
+
+        # Top action bar for narrow screens (always visible)
+        narrow_top_bar = ft.Container(
+            content=glass_container(
+                content=ft.Row(
+                    [
+                        # Filter button
+                        ft.IconButton(
+                            icon=icons.FILTER_LIST,
+                            tooltip=t("filters"),
+                            on_click=self._toggle_drawer,
+                            icon_color=Colors.ACCENT_PRIMARY,
+                        ),
+
+                        ft.Container(expand=True),  # Spacer
+
+                        # Create reservation button
+                        glass_button(
+                            t("create_reservation"),
+                            icon=icons.ADD,
+                            on_click=self._open_create,
+                            variant="primary",
+                            width=None,
+                        ),
+                    ],
+                    alignment=ft.MainAxisAlignment.START,
+                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                ),
+                padding=Spacing.MD,
             ),
-            
-        ],
-        spacing=Spacing.SM,
-        expand=True,
-    )
-    
-    # Determine if we're on a narrow screen (tablet/mobile)
-    # Default to wide screen if window_width is not available (desktop usually starts wide)
-    try:
-        is_narrow_screen = page.window_width and page.window_width < 900
-    except:
-        is_narrow_screen = False
-    
-    # Create drawer for narrow screens (filters only, not action buttons)
-    drawer_content_filters = ft.Column(
-        [
-            # Title
-            heading(t("filters"), size=Typography.SIZE_LG, weight=FontWeight.BOLD),
-            ft.Divider(height=1, color=Colors.BORDER),
-            
-            # Date picker
+            padding=ft.padding.only(left=Spacing.MD, right=Spacing.MD, top=Spacing.SM),
+            visible=is_narrow_screen,
+        )
+
+        # ==========================================
+        # Right Content Area
+        # ==========================================
+
+        # Build content column (with or without top bar for narrow screens)
+        content_column_items = []
+
+        # Add top action bar on narrow screens
+        if is_narrow_screen:
+            content_column_items.append(narrow_top_bar)
+
+        # Add header
+        content_column_items.append(
             ft.Container(
-                content=ft.Column([
-                    label(t("date"), color=Colors.TEXT_SECONDARY),
-                    date_picker_field,
-                ], spacing=4),
-                padding=ft.padding.only(top=Spacing.SM),
-            ),
-            
-            ft.Container(height=Spacing.SM),
-            
-            # Time filters (hour + minute)
-            ft.Row([
-                ft.Container(content=hour_dropdown, expand=True),
-                ft.Container(content=minute_dropdown, expand=True),
-            ], spacing=Spacing.XS),
-            
-            ft.Container(height=Spacing.SM),
-            
-            # Status and Table filters - stacked vertically
-            status_dropdown,
-            
-            ft.Container(height=Spacing.XS),
-            
-            table_dropdown,
-        ],
-        spacing=Spacing.SM,
-        scroll=ScrollMode.AUTO,
-    )
-    
-    drawer = ft.NavigationDrawer(
-        controls=[
+                content=heading(t("reservations"), size=Typography.SIZE_XL, weight=FontWeight.BOLD),
+                padding=ft.padding.only(left=Spacing.LG, top=Spacing.MD, bottom=Spacing.SM),
+            )
+        )
+
+        # Add reservations list
+        content_column_items.append(
             ft.Container(
-                content=glass_container(
-                    content=drawer_content_filters,
-                    padding=Spacing.LG,
-                ),
-                padding=Spacing.MD,
-                height=page.window_height - 100 if hasattr(page, 'window_height') and page.window_height else 800,
+                content=self.reservations_list,
+                padding=ft.padding.symmetric(horizontal=Spacing.LG),
+                expand=True,
             )
-        ],
-        bgcolor=Colors.SURFACE + "E6",  # Semi-transparent
-    )
-    
-    def toggle_drawer(e):
-        """Toggle the navigation drawer on narrow screens."""
-        drawer.open = not drawer.open
-        drawer.update()
-    
-    # Left sidebar (visible on wide screens only)
-    left_sidebar = ft.Container(
-        content=glass_container(
-            content=sidebar_content,
-            padding=Spacing.LG,
-        ),
-        width=240,
-        padding=Spacing.MD,
-        visible=not is_narrow_screen,
-    )
-    
-    # Top action bar for narrow screens (always visible)
-    narrow_top_bar = ft.Container(
-        content=glass_container(
-            content=ft.Row(
-                [
-                    # Filter button
-                    ft.IconButton(
-                        icon=icons.FILTER_LIST,
-                        tooltip=t("filters"),
-                        on_click=toggle_drawer,
-                        icon_color=Colors.ACCENT_PRIMARY,
-                    ),
-                    
-                    ft.Container(expand=True),  # Spacer
-                    
-                    # Create reservation button
-                    glass_button(
-                        t("create_reservation"),
-                        icon=icons.ADD,
-                        on_click=lambda e: action_panel.open_create(app_state),
-                        variant="primary",
-                        width=None,
-                    ),
-                ],
-                alignment=ft.MainAxisAlignment.START,
-                vertical_alignment=ft.CrossAxisAlignment.CENTER,
-            ),
-            padding=Spacing.MD,
-        ),
-        padding=ft.padding.only(left=Spacing.MD, right=Spacing.MD, top=Spacing.SM),
-        visible=is_narrow_screen,
-    )
-    
-    # ==========================================
-    # Right Content Area
-    # ==========================================
-    
-    # Build content column (with or without top bar for narrow screens)
-    content_column_items = []
-    
-    # Add top action bar on narrow screens
-    if is_narrow_screen:
-        content_column_items.append(narrow_top_bar)
-    
-    # Add header
-    content_column_items.append(
-        ft.Container(
-            content=heading(t("reservations"), size=Typography.SIZE_XL, weight=FontWeight.BOLD),
-            padding=ft.padding.only(left=Spacing.LG, top=Spacing.MD, bottom=Spacing.SM),
         )
-    )
-    
-    # Add reservations list
-    content_column_items.append(
-        ft.Container(
-            content=reservations_list,
-            padding=ft.padding.symmetric(horizontal=Spacing.LG),
+
+        self.right_content.content = ft.Column(
+            content_column_items,
+            spacing=0,
+            expand=True,
+        )
+
+        # Initial data load
+        self.refresh_reservations()
+
+        # Add drawer to page for narrow screens
+        if is_narrow_screen:
+            page.drawer = self.drawer
+
+        # Build main layout
+        main_content = ft.Row(
+            [
+                left_sidebar,  # Visible on wide screens, hidden on narrow
+                self.right_content,  # Contains top bar on narrow screens
+                self.action_panel.container,
+            ],
+            spacing=0,
             expand=True,
+            vertical_alignment=ft.CrossAxisAlignment.START,
         )
-    )
-    
-    right_content.content = ft.Column(
-        content_column_items,
-        spacing=0,
-        expand=True,
-    )
-    
-    # Initial data load
-    refresh_reservations()
-    
-    # Add drawer to page for narrow screens
-    if is_narrow_screen:
-        page.drawer = drawer
-    
-    # Build main layout
-    main_content = ft.Row(
-        [
-            left_sidebar,  # Visible on wide screens, hidden on narrow
-            right_content,  # Contains top bar on narrow screens
-            action_panel.container,
-        ],
-        spacing=0,
-        expand=True,
-        vertical_alignment=ft.CrossAxisAlignment.START,
-    )
-
-    # Floating circular button - always on top, bottom-right corner
-    # Always visible on all screen sizes - floats above all content via Stack
-    fab = ft.Container(
-        content=ft.IconButton(
-            icon=icons.TABLE_CHART,
-            icon_color="#FFFFFF",
-            icon_size=28,
-            tooltip=t("to_layout"),
-            on_click=lambda e: app_state.navigate_to("table_layout"),
-            style=ft.ButtonStyle(
-                bgcolor=Colors.ACCENT_PRIMARY,
-                shape=ft.CircleBorder(),
-                padding=ft.padding.all(12),
+
+        # Floating circular button - always on top, bottom-right corner
+        # Always visible on all screen sizes - floats above all content via Stack
+        fab = ft.Container(
+            content=ft.IconButton(
+                icon=icons.TABLE_CHART,
+                icon_color="#FFFFFF",
+                icon_size=28,
+                tooltip=t("to_layout"),
+                on_click=self._navigate_to_layout,
+                style=ft.ButtonStyle(
+                    bgcolor=Colors.ACCENT_PRIMARY,
+                    shape=ft.CircleBorder(),
+                    padding=ft.padding.all(12),
+                ),
             ),
-        ),
-        right=16,
-        bottom=16,
-    )
-
-    # Wrap in Stack so FAB floats above all content
-    return ft.Stack(
-        [
-            main_content,
-            fab,
-        ],
-        expand=True,
-    )
+            right=16,
+            bottom=16,
+        )
+
+        # Wrap in Stack so FAB floats above all content
+        return ft.Stack(
+            [
+                main_content,
+                fab,
+            ],
+            expand=True,
+        )
+
+
+def create_reservations_screen(
+    page: ft.Page,
+    reservation_service: ReservationService,
+    table_layout_service: TableLayoutService,
+    db: DBManager,
+    app_state,
+    refresh_callback: Callable
+):
+    """Create the reservations screen with left sidebar and Action Panel integration."""
+    return ReservationsScreen(
+        page, reservation_service, table_layout_service, db, app_state, refresh_callback
+    ).build()
@@ -5,9 +5,90 @@ Visual grid display of table occupancy states.
 """
 
 import flet as ft
+from functools import lru_cache
 from typing import Callable
 from core import TableLayoutService, TableState
-from ui_flet.compat import Colors, FontWeight, TextAlign, CrossAxisAlignment, MainAxisAlignment, ScrollMode, alignment
+from ui_flet.compat import Colors, FontWeight, TextAlign, CrossAxisAlignment, alignment
+
+
+# Static compat values used per table cell, bound once at import
+_RED, _WHITE, _GREEN, _ORANGE = Colors.RED_400, Colors.WHITE, Colors.GREEN_400, Colors.ORANGE_400
+_LABEL_COLOR = Colors.ORANGE_700
+_BOLD = FontWeight.BOLD
+_TEXT_CENTER = TextAlign.CENTER
+_CROSS_CENTER = CrossAxisAlignment.CENTER
+_ALIGN_CENTER = alignment.center
+
+# Table numbers laid out as 10 rows x 5 columns
+_TABLE_NUMBERS = tuple(tuple(row * 5 + col + 1 for col in range(5)) for row in range(10))
+_NUM_TABLES = sum(len(row) for row in _TABLE_NUMBERS)
+
+# Constant kwargs shared by every table cell
+_BUTTON_KW = dict(bgcolor=_GREEN, padding=15, border_radius=8, alignment=_ALIGN_CENTER)
+_CELL_COLUMN_KW = dict(spacing=5, horizontal_alignment=_CROSS_CENTER)
+
+# TableState -> (button bgcolor, button color, label builder(hhmm))
+_STATE_STYLE = {
+    TableState.OCCUPIED: (_RED, _WHITE, lambda hhmm: ""),
+    TableState.SOON_30: (
+        _ORANGE,
+        _WHITE,
+        lambda hhmm: f"Заета в {hhmm}" if hhmm else "Заета скоро",
+    ),
+    TableState.FREE: (_GREEN, _WHITE, lambda hhmm: ""),
+}
+
+
+@lru_cache(maxsize=8)
+def _format_filter_text(month: str, day: str, hour: str, minute: str) -> str:
+    """Format the filter context (month/day/hour/minute) for the screen header."""
+    text_parts = []
+    if month != "Всички" or day != "Всички":
+        if month == "Всички":
+            text_parts.append(f"Ден {day}")
+        elif day == "Всички":
+            text_parts.append(f"{month}")
+        else:
+            text_parts.append(f"{day} {month}")
+    else:
+        text_parts.append("Всички дни")
+    
+    if hour != "Всички" and minute != "Всички":
+        text_parts.append(f"в {hour}:{minute}")
+    elif hour != "Всички":
+        text_parts.append(f"час {hour}")
+    
+    return " ".join(text_parts)
+
+
+@lru_cache(maxsize=1)
+def _build_header() -> ft.Container:
+    """Build the static screen header (shared across screen re-creations)."""
+    return ft.Container(
+        content=ft.Text("Разпределение на масите", size=24, weight=_BOLD),
+        padding=20,
+        bgcolor=Colors.SURFACE_VARIANT,
+    )
+
+
+@lru_cache(maxsize=1)
+def _build_legend() -> ft.Row:
+    """Build the static state legend (shared across screen re-creations)."""
+    return ft.Row([
+        ft.Text("Легенда:", weight=_BOLD, size=14),
+        ft.Row([
+            ft.Container(width=15, height=15, bgcolor=_GREEN, border_radius=3),
+            ft.Text("Свободна", size=12),
+        ], spacing=5),
+        ft.Row([
+            ft.Container(width=15, height=15, bgcolor=_RED, border_radius=3),
+            ft.Text("Заета сега", size=12),
+        ], spacing=5),
+        ft.Row([
+            ft.Container(width=15, height=15, bgcolor=_ORANGE, border_radius=3),
+            ft.Text("Заета след 30 мин", size=12),
+        ], spacing=5),
+    ], spacing=15)
 
 
 def create_table_layout_screen(
@@ -18,93 +99,61 @@ def create_table_layout_screen(
 ):
     """Create the table layout screen."""
     
-    # Store table containers for updates
-    table_containers = {}
+    # Direct (button, label, cell) refs per table, indexed by table_num - 1
+    table_refs = [None] * _NUM_TABLES
     
-    def refresh_tables():
-        """Refresh table states."""
+    def apply_states():
+        """Apply current table states to the controls without updating the page."""
         selected_dt = filter_context.get_selected_datetime()
-        table_states = table_layout_service.get_table_states_for_context(selected_dt)
+        table_states = table_layout_service.get_table_states_for_context(
+            selected_dt, include_display_time=True
+        )
         
-        for table_num, container in table_containers.items():
-            state, info = table_states[table_num]
+        for index, (button, label, _) in enumerate(table_refs):
+            state, info, hhmm = table_states[index + 1]
             
             # Update button color and label
-            button = container.content.controls[0]
-            label = container.content.controls[1]
-            
-            if state == TableState.OCCUPIED:
-                button.bgcolor = Colors.RED_400
-                button.color = Colors.WHITE
-                label.value = ""
-            elif state == TableState.SOON_30:
-                button.bgcolor = Colors.ORANGE_400
-                button.color = Colors.WHITE
-                if info:
-                    label.value = f"Заета в {info.strftime('%H:%M')}"
-                else:
-                    label.value = "Заета скоро"
-            else:  # FREE
-                button.bgcolor = Colors.GREEN_400
-                button.color = Colors.WHITE
-                label.value = ""
-        
-        page.update()
+            bgcolor, color, label_for = _STATE_STYLE.get(state, _STATE_STYLE[TableState.FREE])
+            button.bgcolor = bgcolor
+            button.color = color
+            label.value = label_for(hhmm)
     
-    # Build table grid
-    table_grid = []
-    for row_idx in range(10):  # 10 rows
-        row_containers = []
-        for col_idx in range(5):  # 5 columns
-            table_num = row_idx * 5 + col_idx + 1
-            
-            button = ft.Container(
-                content=ft.Text(f"Маса {table_num}", size=14, weight=FontWeight.BOLD),
-                bgcolor=Colors.GREEN_400,
-                padding=15,
-                border_radius=8,
-                alignment=alignment.center,
-            )
-            
-            label = ft.Text("", size=10, text_align=TextAlign.CENTER, color=Colors.ORANGE_700)
-            
-            container = ft.Container(
-                content=ft.Column([button, label], spacing=5, horizontal_alignment=CrossAxisAlignment.CENTER),
-                width=120,
-            )
-            
-            table_containers[table_num] = container
-            row_containers.append(container)
+    def make_cell(table_num: int) -> ft.Column:
+        """Build one table cell (button + status label) and register its refs."""
+        button = ft.Container(
+            content=ft.Text(f"Маса {table_num}", size=14, weight=_BOLD),
+            **_BUTTON_KW,
+        )
+        
+        label = ft.Text("", size=10, text_align=_TEXT_CENTER, color=_LABEL_COLOR)
         
-        table_grid.append(ft.Row(row_containers, spacing=10, alignment=MainAxisAlignment.CENTER))
+        cell = ft.Column([button, label], width=120, **_CELL_COLUMN_KW)
+        
+        table_refs[table_num - 1] = (button, label, cell)
+        return cell
+    
+    # Build table grid (10 rows x 5 columns). GridView lays out uniform
+    # cells lazily, so it stays cheap if the number of tables grows.
+    table_grid = ft.GridView(
+        controls=[make_cell(table_num) for row in _TABLE_NUMBERS for table_num in row],
+        runs_count=5,
+        child_aspect_ratio=1.6,
+        spacing=10,
+        run_spacing=10,
+        expand=True,
+    )
     
-    # Initial load
-    refresh_tables()
+    # Initial load - no page.update() here, the caller renders the screen once attached
+    apply_states()
     
     # Filter context display
     def get_filter_text():
-        month = filter_context.selected_month
-        day = filter_context.selected_day
-        hour = filter_context.selected_hour
-        minute = filter_context.selected_minute
-        
-        text_parts = []
-        if month != "Всички" or day != "Всички":
-            if month == "Всички":
-                text_parts.append(f"Ден {day}")
-            elif day == "Всички":
-                text_parts.append(f"{month}")
-            else:
-                text_parts.append(f"{day} {month}")
-        else:
-            text_parts.append("Всички дни")
-        
-        if hour != "Всички" and minute != "Всички":
-            text_parts.append(f"в {hour}:{minute}")
-        elif hour != "Всички":
-            text_parts.append(f"час {hour}")
-        
-        return " ".join(text_parts)
+        return _format_filter_text(
+            filter_context.selected_month,
+            filter_context.selected_day,
+            filter_context.selected_hour,
+            filter_context.selected_minute,
+        )
     
     filter_label = ft.Text(
         f"Дата и час: {get_filter_text()}",
@@ -116,32 +165,14 @@ def create_table_layout_screen(
     return ft.Column(
         [
             # Header
-            ft.Container(
-                content=ft.Text("Разпределение на масите", size=24, weight=FontWeight.BOLD),
-                padding=20,
-                bgcolor=Colors.SURFACE_VARIANT,
-            ),
+            _build_header(),
             
             # Filter context and legend
             ft.Container(
                 content=ft.Column([
                     filter_label,
                     ft.Divider(height=20),
-                    ft.Row([
-                        ft.Text("Легенда:", weight=FontWeight.BOLD, size=14),
-                        ft.Row([
-                            ft.Container(width=15, height=15, bgcolor=Colors.GREEN_400, border_radius=3),
-                            ft.Text("Свободна", size=12),
-                        ], spacing=5),
-                        ft.Row([
-                            ft.Container(width=15, height=15, bgcolor=Colors.RED_400, border_radius=3),
-                            ft.Text("Заета сега", size=12),
-                        ], spacing=5),
-                        ft.Row([
-                            ft.Container(width=15, height=15, bgcolor=Colors.ORANGE_400, border_radius=3),
-                            ft.Text("Заета след 30 мин", size=12),
-                        ], spacing=5),
-                    ], spacing=15),
+                    _build_legend(),
                 ]),
                 padding=20,
             ),
@@ -157,12 +188,7 @@ def create_table_layout_screen(
             
             # Table grid
             ft.Container(
-                content=ft.Column(
-                    table_grid,
-                    spacing=10,
-                    scroll=ScrollMode.AUTO,
-                    horizontal_alignment=CrossAxisAlignment.CENTER,
-                ),
+                content=table_grid,
                 expand=True,
                 padding=20,
             ),
@@ -9,10 +9,12 @@ Features:
 - Internationalization support
 """
 
+import threading
 import flet as ft
-from datetime import date
+from datetime import date, datetime
+from functools import lru_cache
 from typing import Callable, Dict, List, Optional, Tuple
-from core import TableLayoutService, TableState
+from core import TableLayoutService, TableState, RESERVATION_DURATION
 from db import DBManager
 from ui_flet.theme import (Colors, Spacing, Radius, Typography, heading, label, body_text,
                              glass_container, glass_button)
@@ -21,6 +23,52 @@ from ui_flet.i18n import t
 from ui_flet.action_panel import ActionPanel
 
 
+# Above this many changed tables a single page.update() is cheaper
+# than updating each changed container on its own
+_PARTIAL_UPDATE_LIMIT = 8
+
+# Table shape -> (width, height, border_radius); anything else is a RECTANGLE
+_SHAPE_DIMENSIONS = {
+    "ROUND": (50, 50, 25),  # Full circle
+    "SQUARE": (50, 50, Radius.SM),
+}
+_DEFAULT_DIMENSIONS = (55, 45, Radius.SM)
+
+# Fixed "All" section labels (current-language t("all") is checked as well)
+_ALL_LABELS = frozenset(("Всички", "All"))
+
+# Language -> "until" prefix for occupied tables' status label
+_UNTIL_PREFIX = {"bg": "до", "en": "until", "fr": "jusqu'à"}
+
+# Filter changes arriving within this window are coalesced into one refresh
+_REFRESH_DEBOUNCE_SECONDS = 0.05
+
+
+@lru_cache(maxsize=512)
+def _slot_display_times(time_slot: str) -> Optional[Tuple[str, str]]:
+    """
+    Get display times for a reservation time slot.
+    
+    Parses "YYYY-MM-DD HH:MM" by slicing instead of strptime; results are
+    cached, since the same slots come back on every refresh.
+    
+    Returns:
+        ("HH:MM" start, "HH:MM" end) tuple, or None if the slot is malformed
+    """
+    if (len(time_slot) != 16 or time_slot[4] != "-" or time_slot[7] != "-"
+            or time_slot[10] != " " or time_slot[13] != ":"):
+        return None
+    try:
+        dt_start = datetime(
+            int(time_slot[0:4]), int(time_slot[5:7]), int(time_slot[8:10]),
+            int(time_slot[11:13]), int(time_slot[14:16]),
+        )
+    except ValueError:
+        return None
+    dt_end = dt_start + RESERVATION_DURATION
+    return time_slot[11:16], f"{dt_end.hour:02d}:{dt_end.minute:02d}"
+
+
 def create_table_layout_screen(
     page: ft.Page,
     table_layout_service: TableLayoutService,
@@ -33,8 +81,19 @@ def create_table_layout_screen(
     # Get db reference from the service
     db = table_layout_service.db
     
-    # Store table containers for updates
-    table_containers: Dict[int, ft.Container] = {}
+    # Lookups loaded once per screen build (refresh_callback rebuilds the screen)
+    waiter_names = {w["id"]: w["name"] for w in db.get_waiters()}
+    table_shapes = {tbl["table_number"]: tbl["shape"] for tbl in db.get_all_tables()}
+    sections = db.get_all_section_tables()
+    
+    # Section name -> table numbers (only sections that have tables)
+    section_by_name = {section["name"]: section["tables"] for section in sections if section["tables"]}
+    
+    # Store (container, button, status_label) per table for updates
+    table_containers: Dict[int, Tuple[ft.Container, ft.Container, ft.Text]] = {}
+    
+    # Built table refs, reused across section rebuilds: (table_num, shape) -> refs
+    button_pool: Dict[Tuple[int, str], Tuple[ft.Container, ft.Container, ft.Text]] = {}
     
     # Store table states for click handling (table_num -> (state, reservation_info))
     current_table_states: Dict[int, Tuple[TableState, Optional[dict]]] = {}
@@ -42,12 +101,22 @@ def create_table_layout_screen(
     # Currently selected table (for highlight)
     selected_table: Dict[str, Optional[int]] = {"num": None}
     
+    # Last applied (bgcolor, selected, label value, label color) per table
+    applied_looks: Dict[int, tuple] = {}
+    
     # Section containers for the right side
     sections_column = ft.Column(spacing=Spacing.LG, scroll=ScrollMode.AUTO, expand=True)
     
     # Current section filter
     current_section_filter = {"value": t("all")}
     
+    # Debounced refresh state, guarded by refresh_lock. "timer" stays set until
+    # the scheduled refresh has finished, so at most one runs at a time;
+    # "rebuild" is set if any coalesced change needs one, "again" if a change
+    # arrived while a refresh was running, "closed" once the screen is gone
+    pending_refresh = {"timer": None, "rebuild": False, "again": False, "closed": False}
+    refresh_lock = threading.Lock()
+    
     # ==========================================
     # Table Color Helper (with selection support)
     # ==========================================
@@ -61,30 +130,50 @@ def create_table_layout_screen(
         else:  # FREE
             return Colors.TABLE_FREE_SELECTED if is_selected else Colors.TABLE_FREE
     
-    def update_table_selection(new_selected: Optional[int]):
-        """Update the visual selection state for tables."""
+    def update_table_selection(new_selected: Optional[int], defer_update: bool = False):
+        """
+        Update the visual selection state for tables.
+        
+        Args:
+            new_selected: Table number to highlight (None clears the selection)
+            defer_update: If True, leave the page update to the caller
+        """
         old_selected = selected_table["num"]
         selected_table["num"] = new_selected
         
+        # Buttons are restyled here, so force the next refresh to reapply them
+        applied_looks.pop(old_selected, None)
+        applied_looks.pop(new_selected, None)
+        
+        changed_containers = []
+        
         # Update old selection (if any) to remove highlight
         if old_selected is not None and old_selected in table_containers:
             if old_selected in current_table_states:
                 state, _ = current_table_states[old_selected]
-                button = table_containers[old_selected].content.controls[0]
+                container, button, _ = table_containers[old_selected]
                 button.bgcolor = get_table_color(state, is_selected=False)
                 # Remove selection border
                 button.border = None
+                changed_containers.append(container)
         
         # Update new selection (if any) to add highlight
         if new_selected is not None and new_selected in table_containers:
             if new_selected in current_table_states:
                 state, _ = current_table_states[new_selected]
-                button = table_containers[new_selected].content.controls[0]
+                container, button, _ = table_containers[new_selected]
                 button.bgcolor = get_table_color(state, is_selected=True)
                 # Add selection border
                 button.border = ft.border.all(2, Colors.BORDER_SELECTED)
+                changed_containers.append(container)
         
-        page.update()
+        # Only the (at most two) restyled tables need to be sent. Containers
+        # of a discarded screen are skipped (a save rebuilds the screen before
+        # the panel's close callback runs)
+        if not defer_update:
+            attached = [container for container in changed_containers if container.page is not None]
+            if attached:
+                page.update(*attached)
     
     # ==========================================
     # Action Panel for viewing/creating reservations
@@ -162,11 +251,7 @@ def create_table_layout_screen(
         """Get waiter name by ID."""
         if waiter_id is None:
             return ""
-        waiters = db.get_waiters()
-        for w in waiters:
-            if w["id"] == waiter_id:
-                return w["name"]
-        return ""
+        return waiter_names.get(waiter_id, "")
     
     def on_table_click(table_num: int):
         """Handle click on a table button."""
@@ -176,8 +261,8 @@ def create_table_layout_screen(
         
         state, res_data = current_table_states[table_num]
         
-        # Update selection highlight
-        update_table_selection(table_num)
+        # Update selection highlight (sent with the panel's page update below)
+        update_table_selection(table_num, defer_update=True)
         
         # If occupied/soon: show reservation details (read-only)
         if state in (TableState.OCCUPIED, TableState.SOON_30) and res_data:
@@ -190,14 +275,25 @@ def create_table_layout_screen(
             # Pre-fill the table number
             action_panel.table_dropdown.value = str(table_num)
             page.update()
+        
+        # No panel opened - just show the new selection
+        else:
+            page.update()
+    
+    # Last (month, day, hour, minute, language) key and the text built for it
+    last_filter_text = {"key": None, "text": ""}
     
     def get_filter_text():
-        """Get filter context display text."""
+        """Get filter context display text (rebuilt only when the filter changes)."""
         month = app_state.selected_month
         day = app_state.selected_day
         hour = app_state.selected_hour
         minute = app_state.selected_minute
         
+        key = (month, day, hour, minute, app_state.language)
+        if key == last_filter_text["key"]:
+            return last_filter_text["text"]
+        
         text_parts = []
         if month != "Всички" or day != "Всички":
             if month == "Всички":
@@ -214,7 +310,10 @@ def create_table_layout_screen(
         elif hour != "Всички":
             text_parts.append(f"{t('hour')} {hour}")
         
-        return " ".join(text_parts)
+        text = " ".join(text_parts)
+        last_filter_text["key"] = key
+        last_filter_text["text"] = text
+        return text
     
     filter_label = body_text(
         f"{get_filter_text()}",
@@ -223,22 +322,18 @@ def create_table_layout_screen(
     
     def build_table_button(table_num: int) -> ft.Container:
         """Build a single table button with shape from DB and click handler."""
-        # Get table shape from database
-        shape = db.get_table_shape(table_num)
+        # Get table shape (preloaded from the database)
+        shape = table_shapes.get(table_num, "RECTANGLE")
+        
+        # Reuse the container built by an earlier rebuild
+        pool_key = (table_num, shape)
+        refs = button_pool.get(pool_key)
+        if refs is not None:
+            table_containers[table_num] = refs
+            return refs[0]
         
         # Determine dimensions and border radius based on shape
-        if shape == "ROUND":
-            width = 50
-            height = 50
-            border_radius = 25  # Full circle
-        elif shape == "SQUARE":
-            width = 50
-            height = 50
-            border_radius = Radius.SM
-        else:  # RECTANGLE (default)
-            width = 55
-            height = 45
-            border_radius = Radius.SM
+        width, height, border_radius = _SHAPE_DIMENSIONS.get(shape, _DEFAULT_DIMENSIONS)
         
         button = ft.Container(
             content=body_text(
@@ -273,7 +368,9 @@ def create_table_layout_screen(
             width=65,
         )
         
-        table_containers[table_num] = container
+        refs = (container, button, status_label)
+        table_containers[table_num] = refs
+        button_pool[pool_key] = refs
         return container
     
     def build_section_box(section_name: str, table_numbers: List[int]) -> ft.Container:
@@ -335,28 +432,59 @@ def create_table_layout_screen(
         current_table_states.clear()
         current_table_states.update(table_states)
         
-        # Update filter label
-        filter_label.value = f"{get_filter_text()}"
+        # Update filter label (skip the assignment when the text is unchanged)
+        filter_text = get_filter_text()
+        label_changed = filter_label.value != filter_text
+        if label_changed:
+            filter_label.value = filter_text
         
         # Get current selection
         current_selected = selected_table["num"]
         
-        for table_num, container in table_containers.items():
+        # "until" prefix for occupied tables - language is fixed for the whole loop
+        prefix = _UNTIL_PREFIX.get(app_state.language, "до")
+        
+        # New containers (after a rebuild) are not on the page yet
+        needs_page_update = not applied_looks
+        changed_containers = []
+        
+        for table_num, (container, button, status_label) in table_containers.items():
             # Check if table_num exists in table_states (might be deleted)
             if table_num not in table_states:
                 continue
                 
             state, info = table_states[table_num]
             
-            # Get the button and label from the container
-            button = container.content.controls[0]
-            status_label = container.content.controls[1]
-            
             # Check if this table is selected
             is_selected = (table_num == current_selected)
             
+            # Resolve status label (the color is left as-is for FREE tables)
+            label_value = ""
+            label_color = status_label.color
+            slot_times = None
+            if info and isinstance(info, dict):
+                slot_times = _slot_display_times(info.get("time_slot") or "")
+            
+            if state == TableState.OCCUPIED:
+                # Show "until HH:MM" for occupied tables
+                # Format as "до HH:MM" (Bulgarian) or "until HH:MM" (English)
+                if slot_times:
+                    label_value = f"{prefix} {slot_times[1]}"
+                    label_color = Colors.DANGER
+            elif state == TableState.SOON_30:
+                # Show the start time for soon-occupied tables
+                label_value = slot_times[0] if slot_times else t("occupied_soon")[:5]
+                label_color = Colors.WARNING
+            
+            # Skip tables that already look like this
+            bgcolor = get_table_color(state, is_selected)
+            look = (bgcolor, is_selected, label_value, label_color)
+            if applied_looks.get(table_num) == look:
+                continue
+            applied_looks[table_num] = look
+            
             # Update color based on state and selection
-            button.bgcolor = get_table_color(state, is_selected)
+            button.bgcolor = bgcolor
             
             # Update border for selection
             if is_selected:
@@ -364,76 +492,98 @@ def create_table_layout_screen(
             else:
                 button.border = None
             
-            # Update status label
-            if state == TableState.OCCUPIED:
-                # Show "until HH:MM" for occupied tables
-                if info and isinstance(info, dict):
-                    try:
-                        from datetime import datetime, timedelta
-                        from core import RESERVATION_DURATION_MINUTES
-                        
-                        # Parse start time and calculate end time
-                        dt_start = datetime.strptime(info.get("time_slot", ""), "%Y-%m-%d %H:%M")
-                        dt_end = dt_start + timedelta(minutes=RESERVATION_DURATION_MINUTES)
-                        
-                        # Format as "до HH:MM" (Bulgarian) or "until HH:MM" (English)
-                        time_str = dt_end.strftime("%H:%M")
-                        prefix = "до" if app_state.language == "bg" else "until" if app_state.language == "en" else "jusqu'à" if app_state.language == "fr" else "до"
-                        status_label.value = f"{prefix} {time_str}"
-                        status_label.color = Colors.DANGER
-                    except:
-                        status_label.value = ""
-                else:
-                    status_label.value = ""
-            elif state == TableState.SOON_30:
-                # info is now a dict, extract time_slot for display
-                if info and isinstance(info, dict):
-                    try:
-                        from datetime import datetime
-                        dt = datetime.strptime(info.get("time_slot", ""), "%Y-%m-%d %H:%M")
-                        status_label.value = dt.strftime("%H:%M")
-                    except:
-                        status_label.value = t("occupied_soon")[:5]
-                else:
-                    status_label.value = t("occupied_soon")[:5]
-                status_label.color = Colors.WARNING
-            else:  # FREE
-                status_label.value = ""
+            status_label.value = label_value
+            status_label.color = label_color
+            changed_containers.append(container)
         
-        page.update()
+        if needs_page_update or len(changed_containers) > _PARTIAL_UPDATE_LIMIT:
+            page.update()
+        elif label_changed or changed_containers:
+            # Partial push - the header label goes out with the restyled tables
+            if label_changed:
+                changed_containers.append(filter_label)
+            page.update(*changed_containers)
     
     def rebuild_sections_view():
         """Rebuild the sections view based on current filter."""
         table_containers.clear()
+        applied_looks.clear()
         sections_column.controls.clear()
         
-        sections = db.get_all_section_tables()
         selected_section = current_section_filter["value"]
         
         # Check if "All" selected (in any language)
-        is_all = selected_section == t("all") or selected_section == "Всички" or selected_section == "All"
+        is_all = selected_section in _ALL_LABELS or selected_section == t("all")
         
         if is_all:
-            # Show all sections
-            for section in sections:
-                if section["tables"]:  # Only show sections with tables
-                    section_box = build_section_box(section["name"], section["tables"])
-                    sections_column.controls.append(section_box)
+            # Show all sections (only those with tables)
+            for section_name, tables in section_by_name.items():
+                sections_column.controls.append(build_section_box(section_name, tables))
         else:
             # Show only selected section
-            for section in sections:
-                if section["name"] == selected_section and section["tables"]:
-                    section_box = build_section_box(section["name"], section["tables"])
-                    sections_column.controls.append(section_box)
-                    break
+            tables = section_by_name.get(selected_section)
+            if tables:
+                sections_column.controls.append(build_section_box(selected_section, tables))
         
         # Initial table state refresh
         refresh_tables()
     
+    def start_refresh_timer():
+        """Start the debounce timer (caller holds refresh_lock)."""
+        timer = threading.Timer(_REFRESH_DEBOUNCE_SECONDS, run_scheduled_refresh)
+        timer.daemon = True
+        pending_refresh["timer"] = timer
+        timer.start()
+    
+    def run_scheduled_refresh():
+        """Run the coalesced refresh (rebuilding sections if any change asked for it)."""
+        with refresh_lock:
+            if pending_refresh["closed"]:
+                return
+            rebuild = pending_refresh["rebuild"]
+            pending_refresh["rebuild"] = False
+            pending_refresh["again"] = False
+        try:
+            if rebuild:
+                rebuild_sections_view()
+            else:
+                refresh_tables()
+        finally:
+            with refresh_lock:
+                pending_refresh["timer"] = None
+                # Changes made while this refresh ran get one more pass
+                if pending_refresh["again"] and not pending_refresh["closed"]:
+                    start_refresh_timer()
+    
+    def schedule_refresh(rebuild: bool = False):
+        """Schedule a refresh, coalescing filter changes made in quick succession."""
+        with refresh_lock:
+            if pending_refresh["closed"]:
+                return
+            if rebuild:
+                pending_refresh["rebuild"] = True
+            if pending_refresh["timer"] is not None:
+                pending_refresh["again"] = True
+                return
+            start_refresh_timer()
+    
+    def teardown():
+        """Stop pending refreshes once the screen is replaced."""
+        with refresh_lock:
+            pending_refresh["closed"] = True
+            timer = pending_refresh["timer"]
+        if timer is not None:
+            timer.cancel()
+    
+    app_state.on_screen_teardown = teardown
+    
     def on_section_change(e):
         """Handle section dropdown change."""
+        # Flet also fires on re-selecting the current value - nothing to rebuild
+        if e.control.value == current_section_filter["value"]:
+            return
         current_section_filter["value"] = e.control.value
-        rebuild_sections_view()
+        schedule_refresh(rebuild=True)
     
     # ==========================================
     # Filter Controls (Date, Hour, Minutes)
@@ -444,7 +594,7 @@ def create_table_layout_screen(
         if e.control.value:
             selected_date = e.control.value
             app_state.update_filter(filter_date=selected_date)
-            refresh_tables()
+            schedule_refresh()
     
     def open_date_picker(e):
         """Open the date picker dialog."""
@@ -454,7 +604,7 @@ def create_table_layout_screen(
             if e.control.value:
                 selected_date = e.control.value
                 app_state.update_filter(filter_date=selected_date)
-                refresh_tables()
+                schedule_refresh()
         
         def handle_dismiss(e):
             pass  # Do nothing on dismiss
@@ -507,13 +657,13 @@ def create_table_layout_screen(
         """Handle hour filter change."""
         app_state.selected_hour = e.control.value
         update_date_display()
-        refresh_tables()
+        schedule_refresh()
     
     def on_minute_change(e):
         """Handle minute filter change."""
         app_state.selected_minute = e.control.value
         update_date_display()
-        refresh_tables()
+        schedule_refresh()
     
     # Hour dropdown
     hour_options = [ft.dropdown.Option(t("all"))]
@@ -550,7 +700,6 @@ def create_table_layout_screen(
     )
     
     # Build section dropdown options
-    sections = db.get_all_section_tables()
     section_options = [ft.dropdown.Option(t("all"))]
     for section in sections:
         section_options.append(ft.dropdown.Option(section["name"]))
@@ -17,6 +17,29 @@ from ui_flet.i18n import t, LANGUAGES
 from ui_flet.theme_manager import THEMES
 
 
+def _get_language_options(app_state) -> list:
+    """Get the language dropdown options (flag + code), built once per session."""
+    cache = app_state.settings_options_cache
+    if "languages" not in cache:
+        cache["languages"] = [
+            ft.dropdown.Option(key=lang_code, text=f"{flag} {lang_code.upper()}")
+            for lang_code, flag in LANGUAGES.items()
+        ]
+    return cache["languages"]
+
+
+def _get_theme_options(app_state) -> list:
+    """Get the theme dropdown options (icon + translated name) for the UI language."""
+    cache = app_state.settings_options_cache
+    key = ("themes", app_state.language)
+    if key not in cache:
+        cache[key] = [
+            ft.dropdown.Option(key=theme_code, text=f"{icon} {t(f'theme_{theme_code}')}")
+            for theme_code, icon in THEMES.items()
+        ]
+    return cache[key]
+
+
 def create_user_settings_screen(
     page: ft.Page,
     db: DBManager,
@@ -25,6 +48,21 @@ def create_user_settings_screen(
 ):
     """Create the user settings screen."""
     
+    # Settings rarely change between visits - reuse the screen built for
+    # this language/theme and only re-sync the waiter selection
+    cache_key = (app_state.language, app_state.theme)
+    cached = app_state.settings_screen_cache.get(cache_key)
+    if cached is not None:
+        settings_content, reset_waiter_dropdown = cached
+        reset_waiter_dropdown()
+        return settings_content
+    
+    # Labels used more than once - translate each a single time per build
+    t_language = t("language")
+    t_theme = t("theme")
+    t_waiter = t("current_waiter")
+    t_none = t("none")
+    
     # ==========================================
     # Language Selector
     # ==========================================
@@ -35,19 +73,14 @@ def create_user_settings_screen(
         if new_lang:
             app_state.language = new_lang
             page.title = t("app_title")
+            app_state.settings_screen_cache.clear()
             # Trigger full UI refresh
             refresh_callback()
     
-    # Build language dropdown options with flags
-    language_options = [
-        ft.dropdown.Option(key=lang_code, text=f"{flag} {lang_code.upper()}")
-        for lang_code, flag in LANGUAGES.items()
-    ]
-    
     language_dropdown = ft.Dropdown(
-        label=t("language"),
+        label=t_language,
         value=app_state.language,
-        options=language_options,
+        options=_get_language_options(app_state),
         on_change=on_language_change,
         width=None,
         bgcolor=Colors.SURFACE_GLASS,
@@ -77,19 +110,14 @@ def create_user_settings_screen(
                     ],
                 )
             )
+            app_state.settings_screen_cache.clear()
             # Trigger full UI refresh
             refresh_callback()
     
-    # Build theme dropdown options with icons
-    theme_options = [
-        ft.dropdown.Option(key=theme_code, text=f"{icon} {t(f'theme_{theme_code}')}")
-        for theme_code, icon in THEMES.items()
-    ]
-    
     theme_dropdown = ft.Dropdown(
-        label=t("theme"),
+        label=t_theme,
         value=app_state.theme,
-        options=theme_options,
+        options=_get_theme_options(app_state),
         on_change=on_theme_change,
         width=None,
         bgcolor=Colors.SURFACE_GLASS,
@@ -114,18 +142,19 @@ def create_user_settings_screen(
             except (ValueError, TypeError):
                 app_state.current_waiter_id = None
     
-    # Build waiter dropdown options
-    waiters = db.get_waiters()
-    waiter_options = [ft.dropdown.Option(key="", text=t("none"))]
-    for waiter in waiters:
-        waiter_options.append(
-            ft.dropdown.Option(key=str(waiter["id"]), text=waiter["name"])
-        )
+    def waiter_options() -> list:
+        """"None" plus every waiter (served from DBManager's waiter cache)."""
+        options = [ft.dropdown.Option(key="", text=t_none)]
+        for waiter in db.get_waiters():
+            options.append(
+                ft.dropdown.Option(key=str(waiter["id"]), text=waiter["name"])
+            )
+        return options
     
     waiter_dropdown = ft.Dropdown(
-        label=t("current_waiter"),
+        label=t_waiter,
         value=str(app_state.current_waiter_id) if app_state.current_waiter_id else "",
-        options=waiter_options,
+        options=waiter_options(),
         on_change=on_waiter_change,
         width=None,
         bgcolor=Colors.SURFACE_GLASS,
@@ -134,6 +163,12 @@ def create_user_settings_screen(
         color=Colors.INPUT_TEXT,  # Use theme input text color
     )
     
+    def reset_waiter_dropdown():
+        """Re-sync the waiter dropdown with app state when the screen is reused."""
+        # Waiters may have been edited in admin since
+        waiter_dropdown.options = waiter_options()
+        waiter_dropdown.value = str(app_state.current_waiter_id) if app_state.current_waiter_id else ""
+    
     # ==========================================
     # Build Settings Screen
     # ==========================================
@@ -154,7 +189,7 @@ def create_user_settings_screen(
                             # Language setting
                             ft.Container(
                                 content=ft.Column([
-                                    label(t("language"), color=Colors.TEXT_SECONDARY),
+                                    label(t_language, color=Colors.TEXT_SECONDARY),
                                     ft.Container(height=Spacing.XS),
                                     language_dropdown,
                                 ]),
@@ -164,7 +199,7 @@ def create_user_settings_screen(
                             # Theme setting
                             ft.Container(
                                 content=ft.Column([
-                                    label(t("theme"), color=Colors.TEXT_SECONDARY),
+                                    label(t_theme, color=Colors.TEXT_SECONDARY),
                                     ft.Container(height=Spacing.XS),
                                     theme_dropdown,
                                 ]),
@@ -174,7 +209,7 @@ def create_user_settings_screen(
                             # Waiter setting
                             ft.Container(
                                 content=ft.Column([
-                                    label(t("current_waiter"), color=Colors.TEXT_SECONDARY),
+                                    label(t_waiter, color=Colors.TEXT_SECONDARY),
                                     ft.Container(height=Spacing.XS),
                                     waiter_dropdown,
                                 ]),
@@ -203,4 +238,5 @@ def create_user_settings_screen(
         expand=True,
     )
     
+    app_state.settings_screen_cache[cache_key] = (settings_content, reset_waiter_dropdown)
     return settings_content